@@ -17,54 +17,121 @@ import random
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
 import tyro
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
 
-async def capture_screenshot_playwright(
-    url: str, output_path: Path, wait_time: float = 10.0
-) -> bool:
-    """Capture screenshot using Playwright. Generates both full-size and thumbnail versions."""
-    try:
-        from playwright.async_api import async_playwright
+# Number of scene nodes in the client, or -1 before the viewer has mounted.
+_JS_SCENE_NODE_COUNT = """
+() => window.__viserSceneTree
+    ? Object.keys(window.__viserSceneTree.getState()).length
+    : -1
+"""
+
+_JS_TWO_FRAMES = """
+() => new Promise((r) => requestAnimationFrame(() => requestAnimationFrame(r)))
+"""
 
-    except ImportError:
-        raise SystemExit(
-            "Warning: playwright not installed. Install with: pip install playwright && playwright install chromium"
-        )
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(args=["--use-gl=angle"])
-        # Set viewport to 16:9 aspect ratio with higher resolution for better quality
-        # Using 2x resolution for retina-quality screenshots
-        page = await browser.new_page(
-            viewport={"width": 1280, "height": 720},
-            device_scale_factor=2,  # This gives us 2x DPI
-        )
 
+async def wait_for_port(
+    port: int, process: subprocess.Popen, timeout: float = 30.0
+) -> bool:
+    """Poll until the example's server accepts connections. Returns False if
+    the process exits or the timeout passes first."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline and process.poll() is None:
         try:
-            # Navigate to the page
-            await page.goto(url)
+            _, writer = await asyncio.open_connection("localhost", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return True
+    return False
+
+
+async def wait_for_scene_settled(
+    page: Page,
+    max_wait: float,
+    min_wait: float = 5.0,
+    quiet_period: float = 2.0,
+    poll_interval: float = 0.25,
+) -> None:
+    """Wait until the scene has grown past its first-connect node count and
+    then stopped gaining nodes for ``quiet_period`` seconds, then for one
+    painted frame.
+
+    Many examples create the server before loading their assets (URDFs,
+    splats, downloads), so a scene that stays at its initial count is still
+    loading, not settled. Never returns before ``min_wait``; ``max_wait`` is
+    the hard upper bound."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadline = start + max_wait
+    initial_count = None
+    last_count = None
+    last_change = start
+    while loop.time() < deadline:
+        count = await page.evaluate(_JS_SCENE_NODE_COUNT)
+        now = loop.time()
+        if initial_count is None and count >= 0:
+            initial_count = count
+        if count != last_count:
+            last_count = count
+            last_change = now
+        elif (
+            initial_count is not None
+            and count > initial_count
+            and now - last_change >= quiet_period
+            and now - start >= min_wait
+        ):
+            break
+        await asyncio.sleep(poll_interval)
+    await page.evaluate(_JS_TWO_FRAMES)
+
+
+async def capture_screenshot_playwright(
+    browser: Browser, url: str, output_path: Path, wait_time: float = 15.0
+) -> bool:
+    """Capture screenshot using Playwright. Generates both full-size and thumbnail versions.
+
+    Each capture opens its own page (and context) on the shared ``browser``,
+    so concurrent examples stay isolated without a browser launch apiece."""
+    # Set viewport to 16:9 aspect ratio with higher resolution for better quality
+    # Using 2x resolution for retina-quality screenshots
+    page = await browser.new_page(
+        viewport={"width": 1280, "height": 720},
+        device_scale_factor=2,  # This gives us 2x DPI
+    )
 
-            # Wait for the scene to load
-            await asyncio.sleep(wait_time)
+    try:
+        # Navigate to the page
+        await page.goto(url)
 
-            await page.screenshot(path=str(output_path), type="png")
+        # Wait for the scene to load; wait_time is now an upper bound.
+        await wait_for_scene_settled(page, max_wait=wait_time)
 
-            thumb_path = output_path.parent / "thumbs" / output_path.name
-            thumb_path.parent.mkdir(exist_ok=True)
+        await page.screenshot(path=str(output_path), type="png")
 
-            await page.set_viewport_size({"width": 960, "height": 540})
-            await page.screenshot(path=str(thumb_path), type="png")
+        thumb_path = output_path.parent / "thumbs" / output_path.name
+        thumb_path.parent.mkdir(exist_ok=True)
 
-            print(f"  ✓ Screenshots saved: {output_path.name} (full + thumbnail)")
-            return True
+        await page.set_viewport_size({"width": 960, "height": 540})
+        await page.screenshot(path=str(thumb_path), type="png")
 
-        except Exception as e:
-            print(f"  ✗ Failed to capture screenshot: {e}")
-            return False
-        finally:
-            await browser.close()
+        print(f"  ✓ Screenshots saved: {output_path.name} (full + thumbnail)")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Failed to capture screenshot: {e}")
+        return False
+    finally:
+        await page.close()
 
 
 def extract_title_and_description(file_path: Path) -> Tuple[str, str, str]:
@@ -168,7 +235,11 @@ def find_examples() -> List[Tuple[str, Path, str, str, str]]:
 
 
 async def run_example_and_capture(
-    example_name: str, example_path: Path, output_dir: Path, port: int
+    browser: Browser,
+    example_name: str,
+    example_path: Path,
+    output_dir: Path,
+    port: int,
 ) -> Tuple[str, bool]:
     """Run a single example and capture its screenshot."""
     print(f"Processing {example_name} on port {port}...")
@@ -196,8 +267,8 @@ async def run_example_and_capture(
     )
 
     try:
-        # Wait a bit for the server to start
-        await asyncio.sleep(5.0)
+        # Wait for the server to start
+        server_ready = await wait_for_port(port, process)
 
         # Check if process is still running
         if process.poll() is not None:
@@ -207,9 +278,15 @@ async def run_example_and_capture(
                 print(f"  Error: {stderr}")
             return example_name, False
 
+        # Still running but never started serving (e.g. stuck downloading
+        # assets): screenshotting now would just capture an error page.
+        if not server_ready:
+            print(f"  ✗ {example_name} did not start serving on port {port}")
+            return example_name, False
+
         # Capture screenshot
         url = f"http://localhost:{port}/?dummyWindowDimensions=fill&hideViserLogo=&dummyWindowTitle=localhost:8080"
-        success = await capture_screenshot_playwright(url, output_path)
+        success = await capture_screenshot_playwright(browser, url, output_path)
 
         if success:
             print(f"  ✓ {example_name} completed")
@@ -225,14 +302,30 @@ async def run_example_and_capture(
             process.wait()
 
 
-async def process_batch(
-    batch: List[Tuple[str, Path, str, str, str]], output_dir: Path
+async def process_examples(
+    browser: Browser,
+    examples: List[Tuple[str, Path, str, str, str]],
+    output_dir: Path,
+    max_concurrency: int,
 ) -> List[Tuple[str, bool]]:
-    """Process a batch of examples in parallel with random ports."""
-    tasks = []
+    """Process examples concurrently with random ports.
+
+    Concurrency is bounded by a semaphore rather than fixed batches: a slot is
+    released as soon as any example finishes, so one slow example (e.g. a demo
+    that downloads assets) no longer holds up the rest of its batch."""
+    semaphore = asyncio.Semaphore(max_concurrency)
     used_ports = set()
 
-    for example_name, example_path, _title, _desc, _full_doc in batch:
+    async def run_bounded(
+        example_name: str, example_path: Path, port: int
+    ) -> Tuple[str, bool]:
+        async with semaphore:
+            return await run_example_and_capture(
+                browser, example_name, example_path, output_dir, port
+            )
+
+    tasks = []
+    for example_name, example_path, _title, _desc, _full_doc in examples:
         # Generate a random port between 8080 and 9999
         while True:
             port = random.randint(8080, 9999)
@@ -240,8 +333,7 @@ async def process_batch(
                 used_ports.add(port)
                 break
 
-        task = run_example_and_capture(example_name, example_path, output_dir, port)
-        tasks.append(task)
+        tasks.append(run_bounded(example_name, example_path, port))
 
     return await asyncio.gather(*tasks)
 
@@ -263,31 +355,39 @@ async def capture_all_screenshots(name_filter: str | None, batch_size: int = 8):
 
     print(f"Found {len(all_examples)} total examples")
     print(f"Processing {len(examples)} examples matching '{name_filter}'")
-    print(f"Processing in batches of {batch_size}")
+    print(f"Processing up to {batch_size} examples in parallel")
 
-    # Process examples in batches
-    successful = 0
-    failed = []
+    try:
+        from playwright.async_api import async_playwright
 
-    for i in range(0, len(examples), batch_size):
-        batch = examples[i : i + batch_size]
-        print(
-            f"\nBatch {i // batch_size + 1}/{(len(examples) + batch_size - 1) // batch_size}"
+    except ImportError:
+        raise SystemExit(
+            "Warning: playwright not installed. Install with: pip install playwright && playwright install chromium"
         )
 
-        # Process batch in parallel
-        results = await process_batch(batch, output_dir)
-
-        # Count successes and failures
-        for example_name, success in results:
-            if success:
-                successful += 1
-            else:
-                failed.append(example_name)
+    # Process examples in parallel, sharing one browser across all of them
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            args=[
+                "--use-gl=angle",
+                "--disable-dev-shm-usage",
+                "--disable-background-timer-throttling",
+                "--disable-renderer-backgrounding",
+            ]
+        )
+        try:
+            results = await process_examples(browser, examples, output_dir, batch_size)
+        finally:
+            await browser.close()
 
-        # Small delay between batches
-        if i + batch_size < len(examples):
-            await asyncio.sleep(2.0)
+    # Count successes and failures
+    successful = 0
+    failed = []
+    for example_name, success in results:
+        if success:
+            successful += 1
+        else:
+            failed.append(example_name)
 
     # Summary
     print("\n" + "=" * 50)
@@ -548,11 +648,12 @@ def generate_organized_rst_files(examples: List[Tuple[str, Path, str, str, str]]
 
             stripped_code_lines.append(line)
 
-        # Remove empty lines at the beginning
-        while stripped_code_lines and not stripped_code_lines[0].strip():
-            stripped_code_lines.pop(0)
-
-        stripped_source_code = "\n".join(stripped_code_lines)
+        # Skip empty lines at the beginning
+        code_start = 0
+        while code_start < len(stripped_code_lines) and not (
+            stripped_code_lines[code_start].strip()
+        ):
+            code_start += 1
 
         # Write RST file
         with open(rst_path, "w") as f:
@@ -590,9 +691,8 @@ def generate_organized_rst_files(examples: List[Tuple[str, Path, str, str, str]]
             f.write(".. code-block:: python\n")
             f.write("   :linenos:\n\n")
 
-            # Indent the stripped code
-            for line in stripped_source_code.split("\n"):
-                f.write(f"   {line}\n")
+            # Indent the stripped code, streaming lines straight to the file
+            f.writelines(f"   {line}\n" for line in stripped_code_lines[code_start:])
 
     print(f"Generated {len(examples)} RST files in organized directories")
 
@@ -703,7 +803,7 @@ def main(
 
     Args:
         screenshot_if_name_contains: Only capture screenshots for examples whose name contains this string (case-insensitive). Use empty string to match all examples.
-        batch_size: Number of examples to process in parallel batches.
+        batch_size: Maximum number of examples to process in parallel.
     """
     # Run the main function with screenshot capture
     asyncio.run(capture_all_screenshots(screenshot_if_name_contains, batch_size))
@@ -1255,6 +1255,10 @@ function SceneContextSetter() {
       // (e.g. ``logCamera`` stale-closure fix, see
       // ``tests/e2e/test_dev_settings_log_camera.py``).
       devSettings: viewer.useDevSettings,
+      // Read by ``wait_for_connection``: the control-panel label reads
+      // "Inactive" before the first handshake, so scraping it for
+      // "Connecting..." can't tell "not yet connected" from "connected".
+      websocketState: () => viewer.useGui.get().websocketState,
     };
 
     return () => {
@@ -1263,7 +1267,7 @@ function SceneContextSetter() {
       delete w.__viserSceneTree;
       delete w.__viserTestpoints;
     };
-  }, [mutable, viewer.useSceneTree, viewer.useDevSettings, gl]);
+  }, [mutable, viewer.useSceneTree, viewer.useDevSettings, viewer.useGui, gl]);
 
   return null;
 }
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Generator
+
+import pytest
+
+import viser._client_autobuild
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _skip_client_autobuild() -> Generator[None, None, None]:
+    """Skip the client autobuild check for the whole session.
+
+    No test needs a freshly built client (the e2e suite requires a prebuilt
+    one, see ``make build-client``), and the check would otherwise try to
+    install Node.js whenever the client sources look newer than the build."""
+    original = viser._client_autobuild.ensure_client_is_built
+    viser._client_autobuild.ensure_client_is_built = lambda: None
+    yield
+    viser._client_autobuild.ensure_client_is_built = original
@@ -8,13 +8,16 @@ from pathlib import Path
 from typing import Generator
 
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import Browser, BrowserContext, Page
 
 import viser
-import viser._client_autobuild
 
 from . import vite_manager
-from .utils import find_free_port, wait_for_connection, wait_for_server_ready
+from .utils import (
+    find_free_port,
+    reset_viser_server,
+    wait_for_connection,
+)
 
 TEST_RESULTS_DIR = Path(__file__).resolve().parent.parent.parent / "test-results"
 
@@ -25,9 +28,39 @@ TEST_RESULTS_DIR = Path(__file__).resolve().parent.parent.parent / "test-results
 # wrapping, panel docking). device_scale_factor is pinned to 1 (already the
 # Linux default, explicit for determinism across hosts).
 _E2E_VIEWPORT = {"width": 960, "height": 600}
+_E2E_CONTEXT_ARGS = {
+    "viewport": _E2E_VIEWPORT,
+    "device_scale_factor": 1,
+    "reduced_motion": "reduce",
+}
+
+
+# Keep a test's page running at full speed even when Chromium considers it
+# backgrounded (several pages open under xdist, occluded headless windows), and
+# put shared memory in /tmp because CI containers ship a tiny /dev/shm.
+# --disable-gpu is deliberately absent: WebGL must stay on (SwiftShader on
+# GPU-less runners). --no-sandbox is not listed because it would change
+# nothing: Playwright adds it itself unless chromium_sandbox=True is passed.
+_E2E_CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    # Bursts of synthetic pointer/wheel input would otherwise be rate-limited.
+    "--disable-ipc-flooding-protection",
+]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args: dict) -> dict:
+    """Append lean headless-Chromium flags to pytest-playwright's launch args."""
+    return {
+        **browser_type_launch_args,
+        "args": [*browser_type_launch_args.get("args", []), *_E2E_CHROMIUM_ARGS],
+    }
+
+
+@pytest.fixture(scope="session")
 def browser_context_args(browser_context_args: dict) -> dict:
     """Shrink the viewport to reduce software-WebGL raster cost on CI.
 
@@ -35,12 +68,7 @@ def browser_context_args(browser_context_args: dict) -> dict:
     prefers-reduced-motion (they become instant), so tests keep short fixed
     waits instead of animation-length sleeps. The playground module context
     (dock_helpers) sets the same flag."""
-    return {
-        **browser_context_args,
-        "viewport": _E2E_VIEWPORT,
-        "device_scale_factor": 1,
-        "reduced_motion": "reduce",
-    }
+    return {**browser_context_args, **_E2E_CONTEXT_ARGS}
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -50,8 +78,9 @@ def pytest_configure(config: pytest.Config) -> None:
     expensive -- continuous canvas-frame capture and per-action DOM snapshots
     add ~25-30% CPU to every test, and this suite is CPU-bound, so it directly
     inflates wall-clock time. We therefore leave capture OFF by default; test
-    failures still produce a screenshot + page HTML via
-    ``pytest_runtest_makereport`` below, which is enough for most triage.
+    failures still produce a screenshot (plus page HTML with
+    ``VISER_DUMP_HTML=1``) via ``pytest_runtest_makereport`` below, which is
+    enough for most triage.
 
     Set ``VISER_E2E_CAPTURE=1`` (or pass ``--video``/``--tracing`` explicitly on
     the CLI) to re-enable ``retain-on-failure`` capture when debugging a flaky
@@ -67,7 +96,8 @@ def pytest_configure(config: pytest.Config) -> None:
 
 
 def _save_failure_artifacts(page: Page | None, nodeid: str) -> None:
-    """Write a screenshot + page HTML for a failed test, if a live page exists.
+    """Write a screenshot (+ page HTML if requested) for a failed test, if a
+    live page exists.
 
     Used for both call-phase failures (via the report hook) and setup-phase
     connection failures (via the ``viser_page`` fixture) -- the latter because
@@ -84,20 +114,25 @@ def _save_failure_artifacts(page: Page | None, nodeid: str) -> None:
     artifact_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        page.screenshot(path=str(artifact_dir / "failure.png"))
-    except Exception:
-        pass
-    try:
-        (artifact_dir / "failure.html").write_text(page.content(), encoding="utf-8")
+        # JPEG encodes several times faster than PNG on Chromium's side, and
+        # a triage screenshot doesn't need to be lossless.
+        page.screenshot(path=str(artifact_dir / "failure.jpg"), type="jpeg", quality=90)
     except Exception:
         pass
+    # Serializing the whole DOM is slow for this app, so the HTML dump is
+    # opt-in (VISER_DUMP_HTML=1) while the screenshot is always taken.
+    if os.environ.get("VISER_DUMP_HTML"):
+        try:
+            (artifact_dir / "failure.html").write_text(page.content(), encoding="utf-8")
+        except Exception:
+            pass
 
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(
     item: pytest.Item, call: pytest.CallInfo[None]
 ) -> Generator[None, None, None]:
-    """Capture a screenshot and page HTML on a call-phase test failure.
+    """Capture failure artifacts on a call-phase test failure.
 
     Setup-phase failures (e.g. ``wait_for_connection``'s readiness timeout) are
     handled separately in the ``viser_page`` fixture, because ``item.funcargs``
@@ -113,12 +148,6 @@ def pytest_runtest_makereport(
     _save_failure_artifacts(page, item.nodeid)
 
 
-@pytest.fixture(scope="session", autouse=True)
-def _skip_client_autobuild() -> None:
-    """Skip the client autobuild check -- the client must already be built."""
-    viser._client_autobuild.ensure_client_is_built = lambda: None
-
-
 @pytest.fixture(scope="session", autouse=True)
 def _timer_polling_for_page_waits() -> Generator[None, None, None]:
     """Default ``wait_for_function`` to 50ms TIMER polling instead of rAF.
@@ -147,40 +176,103 @@ def _timer_polling_for_page_waits() -> Generator[None, None, None]:
     Page.wait_for_function = orig  # type: ignore[method-assign]
 
 
+def _start_viser_server() -> viser.ViserServer:
+    """Start a ViserServer on an OS-assigned port.
+
+    ``port=0`` lets the kernel pick the port at bind time, so there is no
+    probe-then-bind race between xdist workers; ``get_port()`` reports the
+    port actually bound. The constructor only returns once the socket is
+    listening, so no readiness probe is needed."""
+    return viser.ViserServer(port=0, verbose=False)
+
+
+@pytest.fixture(scope="session")
+def _session_viser_server() -> Generator[viser.ViserServer, None, None]:
+    """One ViserServer per session (i.e. per xdist worker), shared by every
+    test in a ``shared_server`` module."""
+    server = _start_viser_server()
+    yield server
+    server.stop()
+
+
 @pytest.fixture()
-def viser_server() -> Generator[viser.ViserServer, None, None]:
-    """Start a ViserServer on a random port; stop it on teardown."""
-    max_retries = 3
-    server: viser.ViserServer | None = None
-    for attempt in range(max_retries):
-        port = find_free_port()
-        try:
-            server = viser.ViserServer(port=port, verbose=False)
-            break
-        except OSError:
-            if attempt == max_retries - 1:
-                raise
-    assert server is not None
-    wait_for_server_ready(server.get_port())
+def viser_server(
+    request: pytest.FixtureRequest,
+) -> Generator[viser.ViserServer, None, None]:
+    """Start a ViserServer on a free port; stop it on teardown.
+
+    Modules marked ``shared_server`` instead reuse the session server, reset
+    to an empty scene and GUI before each test. Each test still gets a fresh
+    page, so client state never carries over; only the server boot is saved,
+    which dominates short scene/GUI tests."""
+    if request.node.get_closest_marker("shared_server") is not None:
+        server = request.getfixturevalue("_session_viser_server")
+        reset_viser_server(server)
+        yield server
+        return
+
+    server = _start_viser_server()
     yield server
     server.stop()
 
 
+def _capture_enabled(config: pytest.Config) -> bool:
+    """Whether Playwright video or trace capture is on for this run."""
+    return any(
+        getattr(config.option, name, "off") != "off" for name in ("video", "tracing")
+    )
+
+
+@pytest.fixture(scope="session")
+def _session_browser_context(
+    browser: Browser, browser_context_args: dict
+) -> Generator[BrowserContext, None, None]:
+    """One browser context per session, shared by ``shared_server`` modules.
+
+    Those tests all talk to the same session server, so a fresh context per
+    test buys no isolation the per-test page doesn't already give (the client
+    keeps no cookies or web storage), but costs a context bringup each. Built
+    from ``browser_context_args`` so CLI context options (``--device``,
+    ``--base-url``) still apply."""
+    ctx = browser.new_context(**browser_context_args)
+    yield ctx
+    ctx.close()
+
+
 @pytest.fixture()
 def viser_page(
-    page: Page, viser_server: viser.ViserServer, request: pytest.FixtureRequest
-) -> Page:
+    viser_server: viser.ViserServer, request: pytest.FixtureRequest
+) -> Generator[Page, None, None]:
     """Navigate to the viser server and wait for WebSocket connection.
 
+    ``shared_server`` modules open a new page in the session context and close
+    it on teardown; other tests use pytest-playwright's per-test ``page``. With
+    video or tracing on (``--video``/``--tracing``, ``VISER_E2E_CAPTURE=1``)
+    shared modules also use ``page``: pytest-playwright records and retains
+    artifacts per test context, which a session-wide context would bypass.
+
     If the connection/readiness wait fails (a setup-phase failure), capture a
-    screenshot + HTML before re-raising -- with capture off by default this is
+    screenshot (+ HTML) before re-raising -- with capture off by default this is
     otherwise an artifact-less timeout."""
+    shared = request.node.get_closest_marker(
+        "shared_server"
+    ) is not None and not _capture_enabled(request.config)
+    if shared:
+        ctx: BrowserContext = request.getfixturevalue("_session_browser_context")
+        page = ctx.new_page()
+    else:
+        page = request.getfixturevalue("page")
     try:
-        wait_for_connection(page, viser_server.get_port())
-    except Exception:
-        _save_failure_artifacts(page, request.node.nodeid + "__setup")
-        raise
-    return page
+        try:
+            wait_for_connection(page, viser_server.get_port())
+        except Exception:
+            _save_failure_artifacts(page, request.node.nodeid + "__setup")
+            raise
+        yield page
+    finally:
+        if shared:
+            page.close()
+            ctx.clear_cookies()
 
 
 # ---------------------------------------------------------------------------
@@ -8,6 +8,8 @@ from playwright.sync_api import Page, expect
 
 import viser
 
+from .utils import gui_row_for, wait_for_visible_texts
+
 # --- Tab groups ---
 
 
@@ -22,8 +24,7 @@ def test_tab_group_renders(
     with tab_group.add_tab("Beta"):
         viser_server.gui.add_button("Beta Btn")
 
-    expect(viser_page.get_by_role("tab", name="Alpha")).to_be_visible(timeout=5_000)
-    expect(viser_page.get_by_role("tab", name="Beta")).to_be_visible(timeout=5_000)
+    wait_for_visible_texts(viser_page, "[role='tab']", ["Alpha", "Beta"])
 
 
 def test_tab_group_switching(
@@ -62,11 +63,12 @@ def test_modal_renders_with_content(
         viser_server.gui.add_markdown("Modal body text here")
         viser_server.gui.add_button("Modal Action")
 
-    title = viser_page.locator("text=Test Modal").first
-    expect(title).to_be_visible(timeout=5_000)
-
-    modal_btn = viser_page.get_by_role("button", name="Modal Action")
-    expect(modal_btn).to_be_visible(timeout=5_000)
+    # Mantine renders the modal title as an <h2> inside the dialog.
+    wait_for_visible_texts(
+        viser_page,
+        "[role='dialog'] h2, [role='dialog'] button",
+        ["Test Modal", "Modal Action"],
+    )
 
 
 def test_modal_close(
@@ -106,15 +108,14 @@ def test_rgb_server_update(
     """Updating an RGB value from the server should propagate to the client."""
     handle = viser_server.gui.add_rgb("Dynamic Color", initial_value=(255, 0, 0))
 
-    label = viser_page.locator("label", has_text="Dynamic Color")
-    expect(label).to_be_visible(timeout=5_000)
+    gui_row = gui_row_for(viser_page, "Dynamic Color")
+    expect(gui_row).to_be_visible(timeout=5_000)
 
     handle.value = (0, 255, 0)
 
     # Verify the color change reached the browser by checking the color
     # swatch's background style. Mantine renders a color preview element
     # whose background-color reflects the current value.
-    gui_row = label.locator("xpath=ancestor::div[contains(@class, 'Flex-root')][1]")
     swatch = gui_row.locator("[style*='background']").first
     expect(swatch).to_have_css("background-color", "rgb(0, 255, 0)", timeout=5_000)
 
@@ -140,10 +141,7 @@ def test_vector2_renders(
     """A vector2 input should render with two number inputs."""
     viser_server.gui.add_vector2("Position 2D", initial_value=(1.0, 2.0))
 
-    label = viser_page.locator("label", has_text="Position 2D")
-    expect(label).to_be_visible(timeout=5_000)
-
-    gui_row = label.locator("xpath=ancestor::div[contains(@class, 'Flex-root')][1]")
+    gui_row = gui_row_for(viser_page, "Position 2D")
     inputs = gui_row.locator("input")
     expect(inputs.first).to_be_visible(timeout=5_000)
     assert inputs.count() == 2
@@ -156,10 +154,7 @@ def test_vector2_initial_values(
     """Vector2 inputs should display the correct initial values."""
     viser_server.gui.add_vector2("Vec2 Init", initial_value=(3.5, -1.0))
 
-    label = viser_page.locator("label", has_text="Vec2 Init")
-    expect(label).to_be_visible(timeout=5_000)
-
-    gui_row = label.locator("xpath=ancestor::div[contains(@class, 'Flex-root')][1]")
+    gui_row = gui_row_for(viser_page, "Vec2 Init")
     inputs = gui_row.locator("input")
     expect(inputs.nth(0)).to_have_value("3.5", timeout=5_000)
     expect(inputs.nth(1)).to_have_value("-1", timeout=5_000)
@@ -172,10 +167,7 @@ def test_vector3_renders(
     """A vector3 input should render with three number inputs."""
     viser_server.gui.add_vector3("Position 3D", initial_value=(1.0, 2.0, 3.0))
 
-    label = viser_page.locator("label", has_text="Position 3D")
-    expect(label).to_be_visible(timeout=5_000)
-
-    gui_row = label.locator("xpath=ancestor::div[contains(@class, 'Flex-root')][1]")
+    gui_row = gui_row_for(viser_page, "Position 3D")
     inputs = gui_row.locator("input")
     expect(inputs.first).to_be_visible(timeout=5_000)
     assert inputs.count() == 3
@@ -188,10 +180,7 @@ def test_vector3_server_update(
     """Updating a vector3 value from the server should update the client."""
     handle = viser_server.gui.add_vector3("Dynamic Vec", initial_value=(0.0, 0.0, 0.0))
 
-    label = viser_page.locator("label", has_text="Dynamic Vec")
-    expect(label).to_be_visible(timeout=5_000)
-
-    gui_row = label.locator("xpath=ancestor::div[contains(@class, 'Flex-root')][1]")
+    gui_row = gui_row_for(viser_page, "Dynamic Vec")
     inputs = gui_row.locator("input")
     expect(inputs.first).to_be_visible(timeout=5_000)
 
@@ -212,10 +201,7 @@ def test_button_group_renders(
     """A button group should render all option buttons."""
     viser_server.gui.add_button_group("Mode", options=["Edit", "View", "Delete"])
 
-    for option in ["Edit", "View", "Delete"]:
-        expect(viser_page.get_by_role("button", name=option)).to_be_visible(
-            timeout=5_000
-        )
+    wait_for_visible_texts(viser_page, "button", ["Edit", "View", "Delete"])
 
 
 def test_button_group_click_callback(
@@ -259,15 +245,14 @@ def test_progress_bar_update(
     viser_server: viser.ViserServer,
     viser_page: Page,
 ) -> None:
-    """Updating the progress bar value from the server should not crash."""
+    """Updating the progress bar value from the server should reach the DOM."""
     handle = viser_server.gui.add_progress_bar(25)
 
     progressbar = viser_page.locator("[role='progressbar']")
     expect(progressbar.first).to_be_visible(timeout=5_000)
 
     handle.value = 75
-    viser_page.wait_for_timeout(500)
-    expect(progressbar.first).to_be_visible()
+    expect(progressbar.first).to_have_attribute("aria-valuenow", "75", timeout=5_000)
 
 
 def test_progress_bar_remove(
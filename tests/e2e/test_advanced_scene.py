@@ -19,6 +19,36 @@ from .utils import (
     wait_for_scene_node_visible,
 )
 
+# Fixed geometry, built once at import in the dtypes the server sends over the
+# wire (float32 positions, uint32 faces, uint8 colors), so add_* calls don't
+# re-parse nested lists or cast per test.
+_TRIANGLE_VERTICES = np.array(
+    [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 1.0, 0.0]], dtype=np.float32
+)
+_TRIANGLE_FACES = np.array([[0, 1, 2]], dtype=np.uint32)
+_QUAD_VERTICES = np.array(
+    [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float32
+)
+_QUAD_FACES = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.uint32)
+_AXIS_SEGMENT_POINTS = np.array(
+    [
+        [[0, 0, 0], [1, 0, 0]],
+        [[0, 0, 0], [0, 1, 0]],
+        [[0, 0, 0], [0, 0, 1]],
+    ],
+    dtype=np.float32,
+)
+_AXIS_SEGMENT_COLORS = np.array(
+    [
+        [[255, 0, 0], [255, 0, 0]],
+        [[0, 255, 0], [0, 255, 0]],
+        [[0, 0, 255], [0, 0, 255]],
+    ],
+    dtype=np.uint8,
+)
+_BATCHED_WXYZS = np.tile(np.array([1, 0, 0, 0], dtype=np.float32), (3, 1))
+_BATCHED_POSITIONS = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+
 # --- Mesh rendering ---
 
 
@@ -27,15 +57,10 @@ def test_mesh_simple_in_scene(
     viser_page: Page,
 ) -> None:
     """A simple mesh with vertices and faces should appear in the scene graph."""
-    vertices = np.array(
-        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 1.0, 0.0]], dtype=np.float32
-    )
-    faces = np.array([[0, 1, 2]], dtype=np.uint32)
-
     viser_server.scene.add_mesh_simple(
         "/test_mesh",
-        vertices=vertices,
-        faces=faces,
+        vertices=_TRIANGLE_VERTICES,
+        faces=_TRIANGLE_FACES,
         color=(200, 100, 50),
     )
 
@@ -50,13 +75,10 @@ def test_mesh_simple_wireframe(
     viser_page: Page,
 ) -> None:
     """A wireframe mesh should appear in the scene graph."""
-    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float32)
-    faces = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.uint32)
-
     viser_server.scene.add_mesh_simple(
         "/test_wireframe_mesh",
-        vertices=vertices,
-        faces=faces,
+        vertices=_QUAD_VERTICES,
+        faces=_QUAD_FACES,
         wireframe=True,
         color=(0, 255, 0),
     )
@@ -69,13 +91,10 @@ def test_mesh_simple_remove(
     viser_page: Page,
 ) -> None:
     """Removing a mesh should remove it from the scene graph."""
-    vertices = np.array([[0, 0, 0], [1, 0, 0], [0.5, 1, 0]], dtype=np.float32)
-    faces = np.array([[0, 1, 2]], dtype=np.uint32)
-
     handle = viser_server.scene.add_mesh_simple(
         "/removable_mesh",
-        vertices=vertices,
-        faces=faces,
+        vertices=_TRIANGLE_VERTICES,
+        faces=_TRIANGLE_FACES,
     )
 
     wait_for_scene_node(viser_page, "/removable_mesh")
@@ -132,27 +151,10 @@ def test_line_segments_in_scene(
     viser_page: Page,
 ) -> None:
     """Line segments should appear in the scene graph."""
-    points = np.array(
-        [
-            [[0, 0, 0], [1, 0, 0]],
-            [[0, 0, 0], [0, 1, 0]],
-            [[0, 0, 0], [0, 0, 1]],
-        ],
-        dtype=np.float32,
-    )
-    colors = np.array(
-        [
-            [[255, 0, 0], [255, 0, 0]],
-            [[0, 255, 0], [0, 255, 0]],
-            [[0, 0, 255], [0, 0, 255]],
-        ],
-        dtype=np.uint8,
-    )
-
     viser_server.scene.add_line_segments(
         "/test_lines",
-        points=points,
-        colors=colors,
+        points=_AXIS_SEGMENT_POINTS,
+        colors=_AXIS_SEGMENT_COLORS,
         thickness=0.02,
     )
 
@@ -507,19 +509,10 @@ def test_batched_axes_in_scene(
     viser_page: Page,
 ) -> None:
     """Batched axes should appear in the scene graph."""
-    wxyzs = np.array(
-        [[1, 0, 0, 0], [1, 0, 0, 0], [1, 0, 0, 0]],
-        dtype=np.float32,
-    )
-    positions = np.array(
-        [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
-        dtype=np.float32,
-    )
-
     viser_server.scene.add_batched_axes(
         "/test_batched_axes",
-        batched_wxyzs=wxyzs,
-        batched_positions=positions,
+        batched_wxyzs=_BATCHED_WXYZS,
+        batched_positions=_BATCHED_POSITIONS,
         axes_length=0.3,
         axes_radius=0.01,
     )
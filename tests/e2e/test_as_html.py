@@ -9,7 +9,7 @@ from playwright.sync_api import Page
 
 import viser
 
-from .utils import JS_GET_SCENE_CHILD_NAMES, wait_for_scene_node
+from .utils import JS_GET_SCENE_CHILD_NAMES, wait_for_scene_node, wait_for_scene_nodes
 
 
 def test_as_html_returns_valid_html(
@@ -55,8 +55,7 @@ def test_as_html_renders_scene(
     viser_server.scene.add_box(
         "/render_box", dimensions=(0.5, 0.5, 0.5), color=(0, 0, 255)
     )
-    wait_for_scene_node(viser_page, "/render_sphere")
-    wait_for_scene_node(viser_page, "/render_box")
+    wait_for_scene_nodes(viser_page, ["/render_sphere", "/render_box"])
 
     html = viser_server.scene.as_html()
 
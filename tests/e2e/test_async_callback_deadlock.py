@@ -22,24 +22,13 @@ import pytest
 from playwright.sync_api import Browser
 
 import viser
-import viser._client_autobuild
 
-from .utils import find_free_port, wait_for_connection, wait_for_server_ready
+from .utils import wait_for_connection
 
 
 @pytest.fixture()
 def own_server() -> Generator[viser.ViserServer, None, None]:
-    viser._client_autobuild.ensure_client_is_built = lambda: None
-    server: viser.ViserServer | None = None
-    for attempt in range(3):
-        try:
-            server = viser.ViserServer(port=find_free_port(), verbose=False)
-            break
-        except OSError:
-            if attempt == 2:
-                raise
-    assert server is not None
-    wait_for_server_ready(server.get_port())
+    server = viser.ViserServer(port=0, verbose=False)
     yield server
     server.stop()
 
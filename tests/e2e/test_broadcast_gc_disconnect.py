@@ -30,15 +30,14 @@ def test_disconnect_releases_gc_cursor_promptly() -> None:
 
 def _disconnect_scenario() -> None:
     import time
-    from unittest.mock import patch
 
     from playwright.sync_api import sync_playwright
 
     import viser
-    import viser._client_autobuild
 
-    with patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None):
-        server = viser.ViserServer(verbose=False)
+    # run_isolated uses a thread in this process, so tests/conftest.py's
+    # session-wide autobuild patch already applies here.
+    server = viser.ViserServer(verbose=False)
     try:
         broadcast = server._websock_server._broadcast_buffer
         with sync_playwright() as p:
@@ -16,6 +16,8 @@ from playwright.sync_api import Page, expect
 
 import viser
 
+from .utils import wait_for_websocket_connected
+
 
 def test_darkmode_url_overrides_server_theme(
     viser_server: viser.ViserServer,
@@ -28,10 +30,7 @@ def test_darkmode_url_overrides_server_theme(
 
     port = viser_server.get_port()
     page.goto(f"http://localhost:{port}/?darkMode")
-    page.wait_for_function(
-        "() => !document.body.innerText.includes('Connecting...')",
-        timeout=15_000,
-    )
+    wait_for_websocket_connected(page)
 
     # The rendered color scheme must be dark despite the server theme...
     html = page.locator("html")
@@ -10,7 +10,24 @@ from playwright.sync_api import Page
 
 import viser
 
-from .utils import wait_for_scene_node, wait_for_scene_node_hidden
+from .utils import canvas_center
+
+# Node registered in the Three.js graph and canvas test surface initialized.
+JS_BOX_READY = """
+(nodeName) => {
+    const m = window.__viserMutable;
+    return m?.canvas != null && m.nodeRefFromName?.[nodeName] != null;
+}
+"""
+
+# Node hidden and the hover cursor released, checked in a single poll.
+JS_BOX_HIDDEN_CURSOR_AUTO = """
+(nodeName) => {
+    const m = window.__viserMutable;
+    const obj = m?.nodeRefFromName?.[nodeName];
+    return obj != null && !obj.visible && m.canvas.style.cursor === 'auto';
+}
+"""
 
 
 def test_hover_count_resets_on_visibility_toggle(
@@ -18,14 +35,6 @@ def test_hover_count_resets_on_visibility_toggle(
     viser_page: Page,
 ) -> None:
     """Hiding a hovered clickable node must clear the pointer cursor."""
-    # Create a clickable box with an on_click callback.
-    click_counter = {"count": 0}
-
-    def on_click_handler(
-        event: viser.SceneNodePointerEvent[viser.BoxHandle],
-    ) -> None:
-        click_counter["count"] += 1
-
     # Create a large box that fills most of the viewport for easier targeting.
     box_handle = viser_server.scene.add_box(
         "/test_clickable_box",
@@ -33,29 +42,15 @@ def test_hover_count_resets_on_visibility_toggle(
         position=(0.0, 0.0, 0.0),
         color=(255, 0, 0),
     )
-    box_handle.on_click(on_click_handler)
-
-    # Wait for the box to appear in the scene.
-    wait_for_scene_node(viser_page, "/test_clickable_box")
+    # Registering a click callback is what makes the box hoverable.
+    box_handle.on_click(lambda _: None)
 
-    # Wait for the canvas test surface to be initialized.
     viser_page.wait_for_function(
-        "() => window.__viserMutable?.canvas != null",
-        timeout=5_000,
+        JS_BOX_READY, arg="/test_clickable_box", timeout=10_000
     )
 
-    # Find the canvas element.
-    canvas = viser_page.locator("canvas").first
-
-    # Get canvas center position for hovering.
-    canvas_box = canvas.bounding_box()
-    assert canvas_box is not None, "Canvas bounding box not found"
-
-    center_x = canvas_box["x"] + canvas_box["width"] / 2
-    center_y = canvas_box["y"] + canvas_box["height"] / 2
-
     # Move mouse to the center of the canvas to hover over the box.
-    viser_page.mouse.move(center_x, center_y)
+    viser_page.mouse.move(*canvas_center(viser_page))
 
     # Poll until hover state makes the canvas cursor a pointer.
     viser_page.wait_for_function(
@@ -63,14 +58,9 @@ def test_hover_count_resets_on_visibility_toggle(
         timeout=5_000,
     )
 
-    # Now hide the box while the mouse is still hovering over its position.
+    # Now hide the box while the mouse is still hovering over its position;
+    # the node must hide and the cursor must return to auto.
     box_handle.visible = False
-
-    # Wait for the visibility change to propagate to the Three.js scene.
-    wait_for_scene_node_hidden(viser_page, "/test_clickable_box")
-
-    # Verify that cursor returns to auto.
     viser_page.wait_for_function(
-        "() => window.__viserMutable.canvas.style.cursor === 'auto'",
-        timeout=5_000,
+        JS_BOX_HIDDEN_CURSOR_AUTO, arg="/test_clickable_box", timeout=10_000
     )
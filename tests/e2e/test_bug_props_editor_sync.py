@@ -22,7 +22,9 @@ from .utils import wait_for_scene_node
 
 
 def _open_editor(viser_page: Page, node_name: str):
-    viser_page.get_by_label(f"Edit props for {node_name}").click()
+    edit_button = viser_page.get_by_label(f"Edit props for {node_name}")
+    expect(edit_button).to_be_visible(timeout=5_000)
+    edit_button.click()
     popover = viser_page.locator(f'[data-props-popover-for="{node_name}"]')
     expect(popover).to_be_visible(timeout=5_000)
     return popover
@@ -35,7 +37,6 @@ def test_open_prop_editor_reflects_server_update(
     """A prop changed on the server should update the open editor input."""
     handle = viser_server.scene.add_frame("/myframe", axes_length=0.5)
     wait_for_scene_node(viser_page, "/myframe")
-    viser_page.wait_for_timeout(500)
 
     popover = _open_editor(viser_page, "/myframe")
     axes_input = popover.locator('[data-prop-key="axes_length"] input')
@@ -55,7 +56,6 @@ def test_server_update_preserves_in_progress_edit_of_other_field(
         "/myframe", axes_length=0.5, axes_radius=0.0125
     )
     wait_for_scene_node(viser_page, "/myframe")
-    viser_page.wait_for_timeout(500)
 
     popover = _open_editor(viser_page, "/myframe")
     radius_input = popover.locator('[data-prop-key="axes_radius"] input')
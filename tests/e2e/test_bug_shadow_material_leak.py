@@ -6,61 +6,55 @@ are properly disposed when meshes are removed or their shadow opacity changes.
 
 from __future__ import annotations
 
+import pytest
 from playwright.sync_api import Page
 
 import viser
 
-from .utils import wait_for_scene_node, wait_for_scene_node_removed
+# The dispose trackers live on the page's window, and every test gets a fresh
+# page, so these tests can share one server.
+pytestmark = pytest.mark.shared_server
 
 # JS: find the ShadowMaterial under a node and monkey-patch its dispose().
+# Returns false until the material exists, so it doubles as the wait predicate.
 JS_PATCH_SHADOW_MATERIAL_DISPOSE = """
 (nodeName) => {
     const m = window.__viserMutable;
     if (!m || !m.nodeRefFromName) return false;
     const obj = m.nodeRefFromName[nodeName];
     if (!obj) return false;
+    // Per-material tracking state lives in a WeakMap rather than in expando
+    // properties, so the tracker never keeps a material alive by itself.
+    const tracker = (window.__disposeTracker ??= new WeakMap());
     let patched = false;
     obj.traverse((child) => {
-        if (child.isMesh && child.material &&
-            child.material.type === 'ShadowMaterial' &&
-            !child.material.__disposePatched) {
-            child.material.__disposePatched = true;
-            child.material.__wasDisposed = false;
-            const origDispose = child.material.dispose.bind(child.material);
-            child.material.dispose = function() {
-                this.__wasDisposed = true;
-                origDispose();
-            };
-            // Store a global reference so we can check it after the node is removed.
-            window.__trackedShadowMaterial = child.material;
-            patched = true;
+        const mat = child.material;
+        if (!child.isMesh || mat?.type !== 'ShadowMaterial' || tracker.has(mat)) {
+            return;
         }
+        const state = { disposed: false };
+        tracker.set(mat, state);
+        const origDispose = mat.dispose.bind(mat);
+        mat.dispose = function() {
+            state.disposed = true;
+            origDispose();
+        };
+        // Keep the state (not the material) reachable, so it can still be
+        // read after the node is removed and the material is collected.
+        window.__trackedShadowState = state;
+        patched = true;
     });
     return patched;
 }
 """
 
-# JS: check whether a node has a ShadowMaterial child.
-JS_NODE_HAS_SHADOW_MATERIAL = """
+# JS: check that a node is gone and the tracked ShadowMaterial had its
+# dispose() called.
+JS_REMOVED_AND_MATERIAL_DISPOSED = """
 (nodeName) => {
     const m = window.__viserMutable;
-    if (!m || !m.nodeRefFromName) return false;
-    const obj = m.nodeRefFromName[nodeName];
-    if (!obj) return false;
-    let found = false;
-    obj.traverse((child) => {
-        if (child.isMesh && child.material &&
-            child.material.type === 'ShadowMaterial') found = true;
-    });
-    return found;
-}
-"""
-
-# JS: check whether the tracked ShadowMaterial had its dispose() called.
-JS_TRACKED_MATERIAL_WAS_DISPOSED = """
-() => {
-    const mat = window.__trackedShadowMaterial;
-    return mat ? mat.__wasDisposed === true : false;
+    if (!m || !m.nodeRefFromName || m.nodeRefFromName[nodeName] != null) return false;
+    return window.__trackedShadowState?.disposed === true;
 }
 """
 
@@ -78,40 +72,40 @@ def test_shadow_material_disposed_on_remove(
         position=(0.0, 0.0, 0.0),
     )
 
-    # Wait for the node and its ShadowMaterial to appear.
-    wait_for_scene_node(viser_page, "/shadow_box")
+    # Wait for the node's ShadowMaterial to appear, and monkey-patch its
+    # dispose() to track disposal as soon as it does.
     viser_page.wait_for_function(
-        JS_NODE_HAS_SHADOW_MATERIAL, arg="/shadow_box", timeout=10_000
+        JS_PATCH_SHADOW_MATERIAL_DISPOSE, arg="/shadow_box", timeout=10_000
     )
 
-    # Monkey-patch the ShadowMaterial's dispose() to track disposal.
-    patched = viser_page.evaluate(JS_PATCH_SHADOW_MATERIAL_DISPOSE, "/shadow_box")
-    assert patched, "Failed to find and patch ShadowMaterial on the box."
-
-    # Remove the box.
+    # Removing the box should drop the node and dispose the tracked material.
     handle.remove()
-    wait_for_scene_node_removed(viser_page, "/shadow_box")
-
-    # The tracked ShadowMaterial should have been disposed.
-    viser_page.wait_for_function(JS_TRACKED_MATERIAL_WAS_DISPOSED, timeout=10_000)
+    viser_page.wait_for_function(
+        JS_REMOVED_AND_MATERIAL_DISPOSED, arg="/shadow_box", timeout=10_000
+    )
 
 
 JS_SHADOW_MATERIAL_OPACITY = """
 (args) => {
     const [nodeName, expectedOpacity] = args;
-    const m = window.__viserMutable;
-    if (!m || !m.nodeRefFromName) return false;
-    const obj = m.nodeRefFromName[nodeName];
+    const obj = window.__viserMutable?.nodeRefFromName?.[nodeName];
     if (!obj) return false;
-    let found = false;
-    obj.traverse((child) => {
-        if (child.isMesh && child.material &&
-            child.material.type === 'ShadowMaterial' &&
-            Math.abs(child.material.opacity - expectedOpacity) < 0.01) {
-            found = true;
-        }
-    });
-    return found;
+    // Cache the shadow mesh per node (in a WeakMap, like __disposeTracker, so
+    // no expandos land on three.js objects) so later polls skip the traversal;
+    // a cached mesh that has since been detached (parent === null) is re-found.
+    const meshCache = (window.__shadowMeshCache ??= new WeakMap());
+    let mesh = meshCache.get(obj);
+    if (!mesh || mesh.parent === null) {
+        mesh = null;
+        obj.traverse((child) => {
+            if (!mesh && child.isMesh &&
+                child.material?.type === 'ShadowMaterial') mesh = child;
+        });
+        meshCache.set(obj, mesh);
+    }
+    return mesh !== null &&
+        mesh.material.type === 'ShadowMaterial' &&
+        Math.abs(mesh.material.opacity - expectedOpacity) < 0.01;
 }
 """
 
@@ -129,8 +123,7 @@ def test_shadow_material_opacity_update(
         position=(0.0, 0.0, 0.0),
     )
 
-    # Wait for the node and its ShadowMaterial to appear with opacity 0.3.
-    wait_for_scene_node(viser_page, "/opacity_box")
+    # Wait for the node's ShadowMaterial to appear with opacity 0.3.
     viser_page.wait_for_function(
         JS_SHADOW_MATERIAL_OPACITY, arg=["/opacity_box", 0.3], timeout=10_000
     )
@@ -3,42 +3,71 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from playwright.sync_api import Page
 
 import viser
 
-from .utils import wait_for_scene_node
+# The dispose trackers live on the page's window, and every test gets a fresh
+# page, so these tests can share one server.
+pytestmark = pytest.mark.shared_server
 
-# JS: check if the image node has a texture loaded on its material.
-JS_HAS_TEXTURE = """
+# JS: install the texture tracker once. ``window.__trackImageTexture()`` records
+# the texture on /test_image in ``window.textureHistory`` (if not seen yet),
+# wraps that texture's ``dispose`` to flag the record, and returns the record
+# for the texture currently on the material (or null if none is loaded).
+JS_INSTALL_TEXTURE_TRACKER = """
 () => {
-    const nodeRef = window.__viserMutable?.nodeRefFromName?.['/test_image'];
-    if (!nodeRef) return false;
-    let found = false;
-    nodeRef.traverse((obj) => {
-        if (obj.material && obj.material.map && obj.material.map.isTexture) {
-            found = true;
+    window.textureHistory = [];
+    // Textured mesh per node, kept in a WeakMap so no expandos land on
+    // three.js objects.
+    const meshCache = new WeakMap();
+    window.__trackImageTexture = () => {
+        const nodeRef = window.__viserMutable?.nodeRefFromName?.['/test_image'];
+        if (!nodeRef) return null;
+        // Cache the textured mesh so polls skip the traversal; a cached mesh
+        // that has since been detached (parent === null) is re-found.
+        let mesh = meshCache.get(nodeRef);
+        if (!mesh || mesh.parent === null) {
+            mesh = null;
+            nodeRef.traverse((obj) => {
+                if (!mesh && obj.material?.map?.isTexture) mesh = obj;
+            });
+            meshCache.set(nodeRef, mesh);
         }
-    });
-    return found;
+        const map = mesh?.material?.map;
+        if (!map?.isTexture) return null;
+        const seen = window.textureHistory.find((t) => t.uuid === map.uuid);
+        if (seen) return seen;
+        const record = { uuid: map.uuid, disposed: false };
+        window.textureHistory.push(record);
+        const originalDispose = map.dispose;
+        map.dispose = function () {
+            record.disposed = true;
+            originalDispose.call(this);
+        };
+        return record;
+    };
 }
 """
 
-# JS: wait until the texture UUID differs from a given value.
-JS_TEXTURE_UUID_CHANGED = """
+# JS: poll until a texture other than ``prevUuid`` is on the material, tracking
+# it in the same pass; resolves to the new texture's UUID.
+JS_TRACK_NEW_TEXTURE = """
 (prevUuid) => {
-    const nodeRef = window.__viserMutable?.nodeRefFromName?.['/test_image'];
-    if (!nodeRef) return false;
-    let changed = false;
-    nodeRef.traverse((obj) => {
-        if (obj.material && obj.material.map && obj.material.map.isTexture) {
-            if (obj.material.map.uuid !== prevUuid) changed = true;
-        }
-    });
-    return changed;
+    const current = window.__trackImageTexture();
+    return current !== null && current.uuid !== prevUuid ? current.uuid : null;
 }
 """
 
+JS_TEXTURE_SUMMARY = """
+() => ({
+    totalCreated: window.textureHistory.length,
+    activeTextures: window.textureHistory.filter((t) => !t.disposed).map((t) => t.uuid),
+    disposedTextures: window.textureHistory.filter((t) => t.disposed).map((t) => t.uuid),
+})
+"""
+
 
 def test_texture_memory_leak_when_updating_image(
     viser_server: viser.ViserServer,
@@ -49,8 +78,14 @@ def test_texture_memory_leak_when_updating_image(
     Verifies the ViserImage component disposes old THREE.Texture instances
     when image data changes, preventing GPU memory leaks.
     """
+    # Install the tracker up front; everything after this is one browser
+    # round trip per image update.
+    viser_page.evaluate(JS_INSTALL_TEXTURE_TRACKER)
+
+    rng = np.random.default_rng()
+
     # Create initial image.
-    initial_image = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    initial_image = rng.integers(0, 256, (100, 100, 3), dtype=np.uint8)
     image_handle = viser_server.scene.add_image(
         "/test_image",
         image=initial_image,
@@ -59,151 +94,41 @@ def test_texture_memory_leak_when_updating_image(
         position=(0, 0, 0),
     )
 
-    # Wait for the image to appear in the scene.
-    wait_for_scene_node(viser_page, "/test_image")
-
-    # Wait for the texture to actually load on the material.
-    viser_page.wait_for_function(JS_HAS_TEXTURE, timeout=10_000)
-
-    # Track texture UUIDs to detect leaks.
-    # We'll track which textures are currently active vs which have been disposed.
-    initial_texture_info = viser_page.evaluate("""
-        () => {
-            window.textureHistory = [];  // Track all textures seen
-
-            // Check through React Fiber to find the ViserImage component and its texture
-            const nodeRef = window.__viserMutable?.nodeRefFromName?.['/test_image'];
-            let currentTexture = null;
-            if (nodeRef) {
-                nodeRef.traverse((obj) => {
-                    if (obj.material && obj.material.map && obj.material.map.isTexture) {
-                        currentTexture = {
-                            uuid: obj.material.map.uuid,
-                            disposed: false
-                        };
-                        window.textureHistory.push(currentTexture);
-
-                        // Override dispose to track when textures are disposed
-                        const originalDispose = obj.material.map.dispose;
-                        obj.material.map.dispose = function() {
-                            currentTexture.disposed = true;
-                            originalDispose.call(this);
-                        };
-                    }
-                });
-            }
-
-            return {
-                currentUuid: currentTexture ? currentTexture.uuid : null,
-                totalCount: window.textureHistory.length
-            };
-        }
-    """)
+    # Wait for the first texture to load on the material, and track it.
+    prev_uuid = viser_page.wait_for_function(
+        JS_TRACK_NEW_TEXTURE, arg=None, timeout=10_000
+    ).json_value()
 
-    print(f"Initial texture info: {initial_texture_info}")
-
-    # Track the current texture UUID so we can detect when it changes.
-    prev_uuid = initial_texture_info.get("currentUuid")
+    # Build all 10 update images up front: random content, plus a red stripe
+    # in rows [10 * i, 10 * (i + 1)) of image i to ensure each one differs.
+    updates = rng.integers(0, 256, (10, 100, 100, 3), dtype=np.uint8)
+    stripe_rows = np.arange(100) // 10 == np.arange(10)[:, None]
+    updates[..., 0][stripe_rows] = 255
 
     # Update the image 10 times with different content.
     for i in range(10):
-        # Create a new random image with different content.
-        new_image = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
-        # Add some pattern to ensure it's different.
-        new_image[i * 10 : (i + 1) * 10, :, 0] = 255  # Red stripe.
-
-        # Update the image.
-        image_handle.image = new_image
-
-        # Wait until the texture UUID changes (proving the update was processed).
-        if prev_uuid is not None:
-            viser_page.wait_for_function(
-                JS_TEXTURE_UUID_CHANGED, arg=prev_uuid, timeout=10_000
-            )
-
-        # Track new textures created after each update.
-        texture_info = viser_page.evaluate("""
-            () => {
-                // Check the image node for new textures
-                const nodeRef = window.__viserMutable?.nodeRefFromName?.['/test_image'];
-                let currentTexture = null;
-
-                if (nodeRef) {
-                    nodeRef.traverse((obj) => {
-                        if (obj.material && obj.material.map && obj.material.map.isTexture) {
-                            // Check if this is a new texture we haven't seen
-                            const existingTexture = window.textureHistory.find(t => t.uuid === obj.material.map.uuid);
-                            if (!existingTexture) {
-                                currentTexture = {
-                                    uuid: obj.material.map.uuid,
-                                    disposed: false
-                                };
-                                window.textureHistory.push(currentTexture);
-
-                                // Override dispose to track when textures are disposed
-                                const originalDispose = obj.material.map.dispose;
-                                obj.material.map.dispose = function() {
-                                    currentTexture.disposed = true;
-                                    originalDispose.call(this);
-                                };
-                            } else {
-                                currentTexture = existingTexture;
-                            }
-                        }
-                    });
-                }
-
-                // Count how many textures are NOT disposed
-                const activeTextures = window.textureHistory.filter(t => !t.disposed);
-                const disposedTextures = window.textureHistory.filter(t => t.disposed);
-
-                return {
-                    currentUuid: currentTexture ? currentTexture.uuid : null,
-                    totalCreated: window.textureHistory.length,
-                    activeCount: activeTextures.length,
-                    disposedCount: disposedTextures.length
-                };
-            }
-        """)
-
-        print(f"Update {i + 1}: {texture_info}")
-        prev_uuid = texture_info.get("currentUuid")
-
-    # Final check - analyze texture disposal pattern.
-    final_texture_analysis = viser_page.evaluate("""
-        () => {
-            const result = {
-                totalCreated: window.textureHistory.length,
-                activeTextures: [],
-                disposedTextures: []
-            };
-
-            window.textureHistory.forEach(tex => {
-                if (tex.disposed) {
-                    result.disposedTextures.push(tex.uuid);
-                } else {
-                    result.activeTextures.push(tex.uuid);
-                }
-            });
+        image_handle.image = updates[i]
 
-            return result;
-        }
-    """)
+        # Wait until the texture UUID changes (proving the update was
+        # processed); the new texture is tracked by the same poll.
+        prev_uuid = viser_page.wait_for_function(
+            JS_TRACK_NEW_TEXTURE, arg=prev_uuid, timeout=10_000
+        ).json_value()
 
-    print("\nFinal texture analysis:")
-    print(f"  Total textures created: {final_texture_analysis['totalCreated']}")
-    print(f"  Active (not disposed): {len(final_texture_analysis['activeTextures'])}")
-    print(f"  Disposed: {len(final_texture_analysis['disposedTextures'])}")
+    # Final check - analyze texture disposal pattern.
+    final_texture_analysis = viser_page.evaluate(JS_TEXTURE_SUMMARY)
 
     # If textures are properly disposed, we should have:
     # - Only 1 active texture (the current one).
     # - All others should be disposed.
     active_count = len(final_texture_analysis["activeTextures"])
+    disposed_count = len(final_texture_analysis["disposedTextures"])
     total_created = final_texture_analysis["totalCreated"]
 
     # Assert that only the current texture is active, all others are disposed.
     assert active_count <= 2, (
         f"Found {active_count} active (non-disposed) textures after {total_created} total created. "
         f"Expected at most 2 active textures if properly managed (current + maybe loading), "
-        f"but {active_count} textures are still in memory, indicating a leak."
+        f"but {active_count} textures are still in memory, indicating a leak "
+        f"({disposed_count} disposed; active: {final_texture_analysis['activeTextures']})."
     )
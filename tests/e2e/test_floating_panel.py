@@ -8,6 +8,7 @@ dock state via ``data-dock-side`` (``"none" | "left" | "right"``)."""
 
 from __future__ import annotations
 
+import pytest
 from playwright.sync_api import FloatRect, Page, ViewportSize, expect
 
 import viser
@@ -17,6 +18,13 @@ import viser
 _VIEWPORT: ViewportSize = {"width": 1280, "height": 720}
 
 
+@pytest.fixture()
+def browser_context_args(browser_context_args: dict) -> dict:
+    """Open every page at ``_VIEWPORT`` instead of resizing (and re-laying out)
+    after the viewer has already mounted."""
+    return {**browser_context_args, "viewport": _VIEWPORT}
+
+
 def _bbox(page: Page, testid: str) -> FloatRect:
     box = page.get_by_test_id(testid).bounding_box()
     assert box is not None, f"no bounding box for {testid!r}"
@@ -62,9 +70,6 @@ def _drag_handle_to(page: Page, end: tuple[float, float], steps: int = 25) -> No
 
 def test_floating_panel_default_placement(viser_page: Page) -> None:
     """By default the panel floats (no dock) in the upper-right corner."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     expect(viser_page.get_by_test_id("floating-panel")).to_be_visible()
     assert _dock_side(viser_page) == "none"
 
@@ -79,9 +84,6 @@ def test_floating_panel_default_placement(viser_page: Page) -> None:
 def test_drag_moves_floating_panel(viser_page: Page) -> None:
     """Dragging the handle (away from any edge) repositions the panel without
     docking it."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     before = _panel_box(viser_page)
     start = _center(_bbox(viser_page, "floating-panel-handle"))
     # Move well clear of both edges so no dock is offered.
@@ -96,9 +98,6 @@ def test_drag_moves_floating_panel(viser_page: Page) -> None:
 def test_drag_to_left_edge_docks(viser_page: Page) -> None:
     """Dragging the handle to the left edge docks the panel there: it pins to
     the edge, fills the height, and the canvas insets to reserve its column."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     start = _center(_bbox(viser_page, "floating-panel-handle"))
     _drag_handle_to(viser_page, (20, start[1]))
 
@@ -116,9 +115,6 @@ def test_drag_to_left_edge_docks(viser_page: Page) -> None:
 
 def test_drag_to_right_edge_docks(viser_page: Page) -> None:
     """Dragging the handle to the right edge docks the panel on the right."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     start = _center(_bbox(viser_page, "floating-panel-handle"))
     _drag_handle_to(viser_page, (_VIEWPORT["width"] - 20, start[1]))
 
@@ -138,9 +134,6 @@ def test_undock_by_dragging_to_center(viser_page: Page) -> None:
 
     Docks to the right rather than the left so the handle ends up clear of the
     top-left notifications layer, which would otherwise intercept the grab."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     # Dock right first.
     start = _center(_bbox(viser_page, "floating-panel-handle"))
     _drag_handle_to(viser_page, (_VIEWPORT["width"] - 20, start[1]))
@@ -159,9 +152,6 @@ def test_undock_by_dragging_to_center(viser_page: Page) -> None:
 
 def test_resize_right_grip_widens_panel(viser_page: Page) -> None:
     """Dragging the right resize grip outward increases the panel width."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     before = _panel_box(viser_page)
     grip = _center(_bbox(viser_page, "floating-panel-resize-right"))
     _drag(viser_page, grip, (grip[0] + 120, grip[1]))
@@ -174,9 +164,6 @@ def test_resize_right_grip_widens_panel(viser_page: Page) -> None:
 def test_resize_left_grip_keeps_right_edge_pinned(viser_page: Page) -> None:
     """Dragging the left grip outward widens the panel while its right edge
     stays put (the right-anchored resize that avoids jitter)."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     before = _panel_box(viser_page)
     right_before = before["x"] + before["width"]
     grip = _center(_bbox(viser_page, "floating-panel-resize-left"))
@@ -205,9 +192,6 @@ def test_notification_offset_clear_of_left_dock(
 ) -> None:
     """A notification raised while the panel is docked on the left must be
     pushed right so it sits over the canvas, not on top of the GUI."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     # Dock the panel to the left.
     start = _center(_bbox(viser_page, "floating-panel-handle"))
     _drag_handle_to(viser_page, (20, start[1]))
@@ -241,9 +225,6 @@ def test_deprecated_control_layout_docks_right(
     control panel to the right edge (via the new `main_panel` placement path),
     instead of switching to the old sidebar layout. The floating panel stays
     mounted on the dock surface; the canvas insets on the right."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     # Start undocked (default top-right float).
     assert _dock_side(viser_page) == "none"
 
@@ -269,8 +250,6 @@ def test_minimize_floating_keeps_face_bar_geometry(viser_page: Page) -> None:
     again expands it back. (Since D32 the header-click minimize exists ONLY
     on a single-group floating window; the docked flow is the chevron --
     see the companion test.)"""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
     assert _dock_side(viser_page) == "none"
     wide = _panel_box(viser_page)["width"]
 
@@ -312,9 +291,6 @@ def test_docked_collapse_via_chevron_keeps_handle(viser_page: Page) -> None:
     The floating-panel-handle testid follows to the rail cell, and clicking
     it expands the panel again (a lone rail cell's background backs the
     expand, P9)."""
-    viser_page.set_viewport_size(_VIEWPORT)
-    viser_page.wait_for_timeout(300)
-
     # Dock to the right edge.
     _drag_handle_to(viser_page, (_VIEWPORT["width"] - 8, 300))
     assert _dock_side(viser_page) == "right"
@@ -6,15 +6,13 @@ hides the splats (pixels change), and re-showing them works.
 
 from __future__ import annotations
 
-from io import BytesIO
-
 import numpy as np
-from PIL import Image
 from playwright.sync_api import Page
 
 import viser
 
 from .utils import (
+    canvas_rgb,
     wait_for_scene_node,
     wait_for_scene_node_hidden,
     wait_for_scene_node_visible,
@@ -23,9 +21,7 @@ from .utils import (
 
 def _count_colored_pixels(page: Page, min_r: int = 200, max_gb: int = 100) -> int:
     """Count red pixels on the canvas (not the full page, to exclude UI chrome)."""
-    canvas = page.locator("canvas").first
-    screenshot = canvas.screenshot()
-    img = np.array(Image.open(BytesIO(screenshot)).convert("RGB"))
+    img = canvas_rgb(page)
     red_mask = (
         (img[:, :, 0] > min_r) & (img[:, :, 1] < max_gb) & (img[:, :, 2] < max_gb)
     )
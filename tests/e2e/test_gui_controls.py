@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
+import pytest
 from playwright.sync_api import Page, expect
 
 import viser
 
 from .utils import find_gui_input
 
+# Tests here only add/remove GUI elements, so they can share one server.
+pytestmark = pytest.mark.shared_server
+
+# JS: viewport-space top edge of the button with each given text, once every
+# button exists and the edges match the previous poll (layout has settled).
+# Resolves to the array of edges.
+JS_STABLE_BUTTON_TOPS = """
+(names) => {
+    const tops = names.map((name) => {
+        const button = [...document.querySelectorAll('button')]
+            .find((b) => b.textContent.trim() === name);
+        return button ? button.getBoundingClientRect().y : null;
+    });
+    const prev = window.__prevButtonTops;
+    window.__prevButtonTops = tops;
+    if (tops.includes(null) || !prev) return null;
+    return tops.every((y, i) => y === prev[i]) ? tops : null;
+}
+"""
+
 
 def test_button_renders(
     viser_server: viser.ViserServer,
@@ -145,7 +166,7 @@ def test_folder_renders_and_contains_children(
     viser_page: Page,
 ) -> None:
     """A folder should render with its label and contain child elements."""
-    with viser_server.gui.add_folder("Settings"):
+    with viser_server.atomic(), viser_server.gui.add_folder("Settings"):
         viser_server.gui.add_checkbox("Dark Mode Custom", initial_value=False)
         viser_server.gui.add_slider("Volume", min=0, max=100, step=1, initial_value=50)
 
@@ -181,22 +202,17 @@ def test_multiple_gui_elements_order(
 ) -> None:
     """GUI elements should appear in the order they are added."""
     names = ["First Button", "Second Button", "Third Button"]
-    for name in names:
-        viser_server.gui.add_button(name)
-
-    for name in names:
-        expect(viser_page.get_by_role("button", name=name)).to_be_visible(timeout=5_000)
-
-    # Brief reflow buffer before reading bounding boxes.
-    viser_page.wait_for_timeout(300)
-
-    boxes = []
-    for name in names:
-        box = viser_page.get_by_role("button", name=name).bounding_box()
-        assert box is not None
-        boxes.append(box)
-
-    assert boxes[0]["y"] < boxes[1]["y"] < boxes[2]["y"]
+    # One message batch, so the client lays all three out in one render.
+    with viser_server.atomic():
+        for name in names:
+            viser_server.gui.add_button(name)
+
+    # Wait for the buttons to render and their layout to stop moving, instead
+    # of a fixed reflow sleep.
+    tops = viser_page.wait_for_function(
+        JS_STABLE_BUTTON_TOPS, arg=names, timeout=5_000
+    ).json_value()
+    assert tops[0] < tops[1] < tops[2]
 
 
 def test_gui_element_remove(
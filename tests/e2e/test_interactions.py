@@ -4,11 +4,20 @@ from __future__ import annotations
 
 import threading
 
+import pytest
 from playwright.sync_api import Page, expect
 
 import viser
 
-from .utils import find_gui_input, wait_for_scene_node
+from .utils import (
+    find_gui_input,
+    wait_for_scene_node_hidden,
+    wait_for_scene_node_visible,
+)
+
+# Tests here only add GUI elements and scene nodes and attach callbacks to
+# them, so they can share one server.
+pytestmark = pytest.mark.shared_server
 
 
 def test_button_click_callback(
@@ -187,13 +196,14 @@ def test_gui_and_scene_interaction(
         sphere.visible = not sphere.visible
         visibility_toggled.set()
 
-    wait_for_scene_node(viser_page, "/interactive_sphere")
+    wait_for_scene_node_visible(viser_page, "/interactive_sphere")
 
     browser_button = viser_page.get_by_role("button", name="Toggle Sphere")
     expect(browser_button).to_be_visible(timeout=5_000)
     browser_button.click()
 
     assert visibility_toggled.wait(timeout=5.0), "Button callback was not triggered"
+    wait_for_scene_node_hidden(viser_page, "/interactive_sphere")
 
 
 def test_disabled_button_not_clickable(
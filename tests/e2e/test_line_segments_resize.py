@@ -5,20 +5,16 @@ See https://github.com/nerfstudio-project/viser/issues/719.
 
 from __future__ import annotations
 
-from io import BytesIO
-
 import numpy as np
-from PIL import Image
 from playwright.sync_api import Page
 
 import viser
 
-from .utils import wait_for_scene_node
+from .utils import canvas_rgb, wait_for_scene_node
 
 
 def _count_red_pixels(page: Page) -> int:
-    canvas = page.locator("canvas").first
-    img = np.array(Image.open(BytesIO(canvas.screenshot())).convert("RGB"))
+    img = canvas_rgb(page)
     return int(((img[:, :, 0] > 200) & (img[:, :, 1] < 80) & (img[:, :, 2] < 80)).sum())
 
 
@@ -13,16 +13,14 @@ ratio, screen units a ~1x ratio.
 from __future__ import annotations
 
 import math
-from io import BytesIO
 from typing import Literal
 
 import numpy as np
-from PIL import Image
 from playwright.sync_api import Page
 
 import viser
 
-from .utils import wait_for_scene_node
+from .utils import canvas_rgb, wait_for_scene_nodes
 
 # Vertical segments (world +z is the camera's up direction here), one at
 # distance 2 and one at distance 4, offset sideways so they don't overlap
@@ -54,8 +52,7 @@ def _measure_widths(
         thickness_units=thickness_units,
     )
     viser_server.scene.world_axes.visible = False
-    wait_for_scene_node(viser_page, "/near")
-    wait_for_scene_node(viser_page, "/far")
+    wait_for_scene_nodes(viser_page, ["/near", "/far"])
     viser_page.wait_for_timeout(300)
 
     client = list(viser_server.get_clients().values())[0]
@@ -64,8 +61,9 @@ def _measure_widths(
     client.camera.fov = math.radians(75.0)
     viser_page.wait_for_timeout(400)
 
-    canvas = viser_page.locator("canvas").first
-    img = np.array(Image.open(BytesIO(canvas.screenshot())).convert("RGB")).astype(int)
+    # Both segments are vertical pixel columns spanning the mid-height rows;
+    # only those rows are widened for the channel subtraction below.
+    img = canvas_rgb(viser_page)[250:350].astype(np.int16)
     green = (
         (img[:, :, 1] > 150)
         & (img[:, :, 1] > img[:, :, 0] + 60)
@@ -76,12 +74,10 @@ def _measure_widths(
         & (img[:, :, 2] > img[:, :, 0] + 60)
         & (img[:, :, 2] > img[:, :, 1] + 60)
     )
-    # Both segments are vertical pixel columns spanning the mid-height rows;
-    # the per-row pixel count is the projected line width. Median over rows
+    # The per-row pixel count is the projected line width. Median over rows
     # for robustness to antialiased ends.
-    rows = slice(250, 350)
-    near_width = float(np.median(green[rows].sum(axis=1)))
-    far_width = float(np.median(blue[rows].sum(axis=1)))
+    near_width = float(np.median(green.sum(axis=1)))
+    far_width = float(np.median(blue.sum(axis=1)))
     return near_width, far_width
 
 
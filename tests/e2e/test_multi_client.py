@@ -2,59 +2,68 @@
 
 from __future__ import annotations
 
-from typing import Generator
+from typing import Callable, Generator
 
 import pytest
-from playwright.sync_api import Browser, Page, expect
+from playwright.sync_api import Browser, BrowserContext, Page, expect
 
 import viser
-import viser._client_autobuild
 
 from .utils import (
-    find_free_port,
     find_gui_input,
     wait_for_connection,
     wait_for_scene_node,
     wait_for_scene_node_removed,
-    wait_for_server_ready,
 )
 
+# Every test here builds its state on a freshly reset server and connects new
+# pages, so the module shares the per-worker server; only the pages are per test.
+pytestmark = pytest.mark.shared_server
 
-@pytest.fixture()
-def multi_client_setup(browser: Browser) -> Generator[dict, None, None]:
-    """Set up a viser server with two browser pages connected to it.
 
-    Returns a dict with 'server', 'page1', 'page2' keys.
+@pytest.fixture(scope="module")
+def client_contexts(
+    browser: Browser,
+) -> Generator[tuple[BrowserContext, BrowserContext], None, None]:
+    """Two browser contexts, one per simulated client, shared by the module."""
+    contexts = (browser.new_context(), browser.new_context())
+    yield contexts
+    for context in contexts:
+        context.close()
+
+
+@pytest.fixture()
+def open_client(
+    client_contexts: tuple[BrowserContext, BrowserContext],
+    viser_server: viser.ViserServer,
+) -> Generator[Callable[[int], Page], None, None]:
+    """Return a function that opens a connected page in client context 0 or 1.
+
+    Pages are opened on demand (so tests can join clients late) and closed on
+    teardown; the contexts themselves outlive the test.
     """
-    viser._client_autobuild.ensure_client_is_built = lambda: None
+    pages: list[Page] = []
 
-    port = find_free_port()
-    max_retries = 3
-    server: viser.ViserServer | None = None
-    for attempt in range(max_retries):
-        port = find_free_port()
-        try:
-            server = viser.ViserServer(port=port, verbose=False)
-            break
-        except OSError:
-            if attempt == max_retries - 1:
-                raise
-    assert server is not None
-    wait_for_server_ready(port)
+    def open_(index: int) -> Page:
+        page = client_contexts[index].new_page()
+        pages.append(page)
+        wait_for_connection(page, viser_server.get_port())
+        return page
 
-    context1 = browser.new_context()
-    context2 = browser.new_context()
-    page1 = context1.new_page()
-    page2 = context2.new_page()
+    yield open_
+    for page in pages:
+        page.close()
 
-    wait_for_connection(page1, port)
-    wait_for_connection(page2, port)
 
-    yield {"server": server, "page1": page1, "page2": page2}
+@pytest.fixture()
+def multi_client_setup(
+    viser_server: viser.ViserServer, open_client: Callable[[int], Page]
+) -> dict:
+    """Set up a viser server with two browser pages connected to it.
 
-    context1.close()
-    context2.close()
-    server.stop()
+    Returns a dict with 'server', 'page1', 'page2' keys.
+    """
+    return {"server": viser_server, "page1": open_client(0), "page2": open_client(1)}
 
 
 def test_two_clients_see_gui(multi_client_setup: dict) -> None:
@@ -212,78 +221,44 @@ def test_form_dirty_clears_on_submit_to_peer(multi_client_setup: dict) -> None:
     expect(dirty_indicator).to_be_hidden(timeout=5_000)
 
 
-def test_late_joining_client_sees_dirty_form(browser: Browser) -> None:
+def test_late_joining_client_sees_dirty_form(
+    viser_server: viser.ViserServer, open_client: Callable[[int], Page]
+) -> None:
     """A client joining after a form is made dirty should see the dirty indicator."""
-    viser._client_autobuild.ensure_client_is_built = lambda: None
-
-    port = find_free_port()
-    max_retries = 3
-    server: viser.ViserServer | None = None
-    for attempt in range(max_retries):
-        port = find_free_port()
-        try:
-            server = viser.ViserServer(port=port, verbose=False)
-            break
-        except OSError:
-            if attempt == max_retries - 1:
-                raise
-    assert server is not None
-    wait_for_server_ready(port)
-
-    with server.gui.add_form("Settings"):
-        server.gui.add_text("Username", initial_value="")
-
-    context1 = browser.new_context()
-    page1 = context1.new_page()
-    wait_for_connection(page1, port)
+    with viser_server.gui.add_form("Settings"):
+        viser_server.gui.add_text("Username", initial_value="")
+
+    page1 = open_client(0)
 
     input1 = find_gui_input(page1, "Username")
     expect(input1).to_be_visible(timeout=5_000)
     input1.fill("bob")
 
     # Late-joining client connects after the form is already dirty.
-    context2 = browser.new_context()
-    page2 = context2.new_page()
-    wait_for_connection(page2, port)
+    page2 = open_client(1)
 
     dirty_indicator = page2.locator("span[style*='opacity']", has_text="*")
     expect(dirty_indicator).to_be_visible(timeout=5_000)
 
-    context1.close()
-    context2.close()
-    server.stop()
 
-
-def test_per_client_form_dirty_is_isolated(browser: Browser) -> None:
+def test_per_client_form_dirty_is_isolated(
+    viser_server: viser.ViserServer, open_client: Callable[[int], Page]
+) -> None:
     """Dirty state on a per-client form should not bleed to other clients."""
-    viser._client_autobuild.ensure_client_is_built = lambda: None
-
-    port = find_free_port()
-    max_retries = 3
-    server: viser.ViserServer | None = None
-    for attempt in range(max_retries):
-        port = find_free_port()
-        try:
-            server = viser.ViserServer(port=port, verbose=False)
-            break
-        except OSError:
-            if attempt == max_retries - 1:
-                raise
-    assert server is not None
-
-    @server.on_client_connect
+    # on_client_connect also fires immediately for clients that are already
+    # connected -- on the shared server, pages from earlier tests that may
+    # still be disconnecting. Only the clients this test opens get the form.
+    earlier_clients = set(viser_server.get_clients())
+
+    @viser_server.on_client_connect
     def _(client: viser.ClientHandle) -> None:
+        if client.client_id in earlier_clients:
+            return
         with client.gui.add_form("Per-client Form"):
             client.gui.add_text("Note", initial_value="")
 
-    wait_for_server_ready(port)
-
-    context1 = browser.new_context()
-    context2 = browser.new_context()
-    page1 = context1.new_page()
-    page2 = context2.new_page()
-    wait_for_connection(page1, port)
-    wait_for_connection(page2, port)
+    page1 = open_client(0)
+    page2 = open_client(1)
 
     # Both clients have their own independent form.
     input1 = find_gui_input(page1, "Note")
@@ -298,44 +273,21 @@ def test_per_client_form_dirty_is_isolated(browser: Browser) -> None:
     expect(dirty1).to_be_visible(timeout=5_000)
     expect(dirty2).to_be_hidden(timeout=2_000)
 
-    context1.close()
-    context2.close()
-    server.stop()
-
 
-def test_late_joining_client_sees_state(browser: Browser) -> None:
+def test_late_joining_client_sees_state(
+    viser_server: viser.ViserServer, open_client: Callable[[int], Page]
+) -> None:
     """A client joining after GUI/scene elements are added should see them."""
-    viser._client_autobuild.ensure_client_is_built = lambda: None
-
-    port = find_free_port()
-    max_retries = 3
-    server: viser.ViserServer | None = None
-    for attempt in range(max_retries):
-        port = find_free_port()
-        try:
-            server = viser.ViserServer(port=port, verbose=False)
-            break
-        except OSError:
-            if attempt == max_retries - 1:
-                raise
-    assert server is not None
-    wait_for_server_ready(port)
-
-    server.gui.add_button("Pre-existing Button")
-    server.scene.add_icosphere(
+    viser_server.gui.add_button("Pre-existing Button")
+    viser_server.scene.add_icosphere(
         "/pre_existing_sphere",
         radius=0.3,
         color=(0, 0, 255),
     )
 
-    context = browser.new_context()
-    page = context.new_page()
-    wait_for_connection(page, port)
+    page = open_client(0)
 
     expect(page.get_by_role("button", name="Pre-existing Button")).to_be_visible(
         timeout=5_000
     )
     wait_for_scene_node(page, "/pre_existing_sphere")
-
-    context.close()
-    server.stop()
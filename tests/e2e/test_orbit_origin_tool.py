@@ -28,6 +28,8 @@ from playwright.sync_api import Page
 
 import viser
 
+from .utils import wait_for_websocket_connected
+
 # Find the pivot gizmo, project a translation-arrow handle and the gizmo
 # center to viewport (CSS-pixel) coordinates Playwright can drag. The arrow
 # hit targets are the (invisible) cylinder-geometry meshes; the visible line
@@ -169,10 +171,7 @@ def _open_with_orbit_tool(page: Page, port: int) -> None:
     """Open the viewer with the orbit-origin gizmo forced visible and wait
     until the camera controls are live."""
     page.goto(f"http://localhost:{port}/?forceOrbitOriginTool=1")
-    page.wait_for_function(
-        "() => !document.body.innerText.includes('Connecting...')",
-        timeout=15_000,
-    )
+    wait_for_websocket_connected(page)
     page.wait_for_function(
         "() => window.__viserMutable && window.__viserMutable.cameraControl != null",
         timeout=15_000,
@@ -15,9 +15,8 @@ from __future__ import annotations
 from playwright.sync_api import Browser, Page, expect
 
 import viser
-import viser._client_autobuild
 
-from .utils import find_free_port, wait_for_connection, wait_for_server_ready
+from .utils import wait_for_connection
 
 _VIEWPORT = {"width": 1280, "height": 720}
 
@@ -38,20 +37,8 @@ def _leaf_box(page: Page, tab_label: str):
 
 
 def _make_server() -> viser.ViserServer:
-    """A server on a free port (mirrors the conftest retry pattern)."""
-    viser._client_autobuild.ensure_client_is_built = lambda: None
-    server: viser.ViserServer | None = None
-    for attempt in range(3):
-        port = find_free_port()
-        try:
-            server = viser.ViserServer(port=port, verbose=False)
-            break
-        except OSError:
-            if attempt == 2:
-                raise
-    assert server is not None
-    wait_for_server_ready(server.get_port())
-    return server
+    """A server on an OS-assigned port, separate from the shared fixture."""
+    return viser.ViserServer(port=0, verbose=False)
 
 
 def test_add_panel_floats_with_tab(
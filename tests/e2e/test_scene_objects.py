@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from playwright.sync_api import Page, expect
 
 import viser
@@ -15,8 +16,13 @@ from .utils import (
     wait_for_scene_node_hidden,
     wait_for_scene_node_removed,
     wait_for_scene_node_visible,
+    wait_for_scene_nodes,
+    wait_for_scene_nodes_removed,
 )
 
+# Tests here only add/remove scene nodes, so they can share one server.
+pytestmark = pytest.mark.shared_server
+
 
 def test_canvas_exists(
     viser_server: viser.ViserServer,
@@ -106,8 +112,7 @@ def test_multiple_scene_objects(
     viser_server.scene.add_label("/multi/label", text="Multi", position=(0, 0, 1))
 
     expected = ["/multi/sphere", "/multi/box", "/multi/frame", "/multi/label"]
-    for name in expected:
-        wait_for_scene_node(viser_page, name)
+    wait_for_scene_nodes(viser_page, expected)
 
     names = viser_page.evaluate(JS_GET_SCENE_CHILD_NAMES)
     for name in expected:
@@ -147,15 +152,12 @@ def test_scene_reset_removes_existing_nodes(
         dimensions=(0.5, 0.5, 0.5),
     )
 
-    wait_for_scene_node(viser_page, "/reset_parent")
-    wait_for_scene_node(viser_page, "/reset_parent/child_sphere")
-    wait_for_scene_node(viser_page, "/reset_box")
+    reset_nodes = ["/reset_parent", "/reset_parent/child_sphere", "/reset_box"]
+    wait_for_scene_nodes(viser_page, reset_nodes)
 
     viser_server.scene.reset()
 
-    wait_for_scene_node_removed(viser_page, "/reset_parent")
-    wait_for_scene_node_removed(viser_page, "/reset_parent/child_sphere")
-    wait_for_scene_node_removed(viser_page, "/reset_box")
+    wait_for_scene_nodes_removed(viser_page, reset_nodes)
     wait_for_scene_node(viser_page, "/WorldAxes")
 
 
@@ -189,8 +191,7 @@ def test_hierarchical_scene_nodes(
         "/parent/child_sphere", radius=0.2, position=(1, 0, 0)
     )
 
-    wait_for_scene_node(viser_page, "/parent")
-    wait_for_scene_node(viser_page, "/parent/child_sphere")
+    wait_for_scene_nodes(viser_page, ["/parent", "/parent/child_sphere"])
 
     names = viser_page.evaluate(JS_GET_SCENE_CHILD_NAMES)
     assert "/parent" in names
@@ -204,7 +205,11 @@ def test_point_cloud_in_scene(
     """A point cloud should appear in the scene graph."""
     rng = np.random.default_rng(42)
     points = rng.standard_normal((100, 3)).astype(np.float32) * 0.5
-    colors = np.clip((points * 128 + 128), 0, 255).astype(np.uint8)
+    # Scale in place, then clip straight into the uint8 output.
+    scaled = points * 128
+    scaled += 128
+    colors = np.empty(points.shape, dtype=np.uint8)
+    np.clip(scaled, 0, 255, out=colors, casting="unsafe")
 
     viser_server.scene.add_point_cloud(
         "/test_points",
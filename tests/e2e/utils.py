@@ -2,25 +2,38 @@
 
 from __future__ import annotations
 
+import re
 import socket
 import time
+from io import BytesIO
 
+import numpy as np
+from PIL import Image
 from playwright.sync_api import Locator, Page
 
+import viser
+
 # ---------------------------------------------------------------------------
 # Network utilities
 # ---------------------------------------------------------------------------
 
 
 def find_free_port() -> int:
-    """Find a free TCP port by binding to port 0 and reading the assigned port."""
+    """Find a free TCP port by binding to port 0 and reading the assigned port.
+
+    The port is released before the caller binds it, so it can be taken in
+    between. Only use this for processes that can't bind port 0 themselves
+    (e.g. the Vite dev server); pass ``port=0`` to ``ViserServer`` instead."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.bind(("", 0))
         return s.getsockname()[1]
 
 
 def wait_for_server_ready(port: int, timeout: float = 5.0) -> None:
-    """Poll until the server is accepting TCP connections."""
+    """Poll until a server is accepting TCP connections.
+
+    Only needed for out-of-process servers: an in-process ``ViserServer``
+    returns from its constructor once the socket is bound."""
     deadline = time.monotonic() + timeout
     while time.monotonic() < deadline:
         try:
@@ -31,39 +44,108 @@ def wait_for_server_ready(port: int, timeout: float = 5.0) -> None:
     raise RuntimeError(f"Server on port {port} not ready within {timeout}s")
 
 
+def reset_viser_server(server: viser.ViserServer) -> None:
+    """Return a reused server to an empty state between tests.
+
+    Clears the shared scene and GUI, and drops connect/disconnect callbacks a
+    previous test registered. Server-wide configuration (theme, initial
+    camera, up direction) is NOT reset, so only tests that stick to adding and
+    removing scene/GUI elements should share a server."""
+    server.scene.reset()
+    server.gui.reset()
+    # The connect/disconnect handlers snapshot these lists under _client_lock
+    # on the websocket thread; a late connect from the previous test's page
+    # can race with the reset, so clear them under the same lock.
+    with server._client_lock:
+        server._client_connect_cb.clear()
+        server._client_disconnect_cb.clear()
+
+
+def gui_row_for(page: Page, label_text: str) -> Locator:
+    """Find the Mantine Flex row that holds the GUI control labelled exactly
+    ``label_text``.
+
+    Every Flex row enclosing the label matches ``has=``, so rows that contain
+    another matching row (i.e. ancestors) are filtered out, leaving the
+    innermost one -- the same element as an ``ancestor::div[...][1]`` XPath
+    walk from the label. The label is matched exactly (not as a substring), and
+    the locator stays strict: two controls with the same label raise instead
+    of one being picked silently.
+    """
+    label = page.locator("label").filter(
+        has_text=re.compile(rf"^{re.escape(label_text)}$")
+    )
+    row = "div[class*='Flex-root']"
+    return page.locator(row, has=label).filter(has_not=page.locator(row, has=label))
+
+
 def find_gui_input(page: Page, label_text: str) -> Locator:
     """Find the input element in the same GUI control row as a label.
 
-    Navigates from the label up to the Mantine Flex row and finds the
-    ``<input>`` within.  More robust than using the label's ``for``
-    attribute because some Mantine components assign internal IDs that
-    don't match the ``for`` value.
+    Goes through the label's Mantine Flex row and finds the ``<input>``
+    within.  More robust than using the label's ``for`` attribute because
+    some Mantine components assign internal IDs that don't match the ``for``
+    value.
     """
-    label = page.locator("label", has_text=label_text)
-    gui_row = label.locator("xpath=ancestor::div[contains(@class, 'Flex-root')][1]")
-    return gui_row.locator("input:not([type='hidden'])")
+    return gui_row_for(page, label_text).locator("input:not([type='hidden'])")
 
 
-def wait_for_connection(page: Page, port: int) -> None:
-    """Navigate to the viser server and wait for WebSocket connection.
+JS_ALL_TEXTS_VISIBLE = """
+([selector, texts]) => {
+    const shown = [...document.querySelectorAll(selector)]
+        .filter((el) => el.checkVisibility())
+        .map((el) => el.textContent.trim());
+    return texts.every((text) => shown.includes(text));
+}
+"""
+
+
+def wait_for_visible_texts(
+    page: Page, selector: str, texts: list[str], timeout: int = 5_000
+) -> None:
+    """Wait until, for every text, a visible element matching ``selector`` has
+    exactly that (trimmed) text content.
+
+    One predicate polls for all of them at once, instead of one
+    ``expect(...).to_be_visible()`` retry loop per element."""
+    page.wait_for_function(JS_ALL_TEXTS_VISIBLE, arg=[selector, texts], timeout=timeout)
+
+
+JS_CONNECTED = """
+() => {
+    const t = window.__viserTestpoints;
+    if (window.__viserMutable == null || t == null) return false;
+    // Builds from before the websocketState testpoint can never report a
+    // connection; hand back a marker so the caller can say so immediately.
+    if (typeof t.websocketState !== 'function') return 'stale-client-build';
+    return t.websocketState() === 'connected';
+}
+"""
 
-    The ConnectionStatus component displays "Connecting..." while disconnected
-    and switches once the WebSocket handshake completes. We then wait for the
-    R3F scene context to mount -- ``window.__viserMutable`` is published by
-    ``SceneContextSetter`` once the canvas + WebGL scene are live -- which is a
-    real readiness signal rather than a blind settle delay.
+
+def wait_for_websocket_connected(page: Page, timeout: int = 15_000) -> None:
+    """Wait until the already-loaded viser client reports a live WebSocket.
+
+    ``SceneContextSetter`` publishes ``window.__viserMutable`` and
+    ``window.__viserTestpoints`` once the canvas + WebGL scene are live; the
+    latter's ``websocketState()`` reads the GUI store directly, so each poll is
+    a property read rather than a whole-document ``innerText`` flatten (and,
+    unlike the control-panel label, it distinguishes the pre-handshake
+    "inactive" state from "connected").
     """
+    result = page.wait_for_function(JS_CONNECTED, timeout=timeout).json_value()
+    if result == "stale-client-build":
+        raise RuntimeError(
+            "The viser client build is out of date (no websocketState "
+            "testpoint); the e2e suite skips autobuild, so rebuild it with "
+            "`make build-client`."
+        )
+
+
+def wait_for_connection(page: Page, port: int) -> None:
+    """Navigate to the viser server and wait for WebSocket connection."""
     page.goto(f"http://localhost:{port}")
-    page.wait_for_function(
-        """() => {
-            const body = document.body.innerText;
-            if (body.includes('Connecting...')) return false;
-            // Scene context is live once SceneContextSetter publishes the
-            // mutable handle on window (canvas + WebGL scene mounted).
-            return window.__viserMutable != null;
-        }""",
-        timeout=15_000,
-    )
+    wait_for_websocket_connected(page)
 
 
 # ---------------------------------------------------------------------------
@@ -153,6 +235,28 @@ def wait_for_scene_node(page: Page, node_name: str, timeout: int = 10_000) -> No
     page.wait_for_function(JS_SCENE_HAS_NODE, arg=node_name, timeout=timeout)
 
 
+# Multi-node forms of the predicates above: one poll checks every name, rather
+# than one wait_for_function round trip per node.
+JS_SCENE_HAS_NODES = f"(nodeNames) => nodeNames.every({JS_SCENE_HAS_NODE.strip()})"
+JS_SCENE_NODES_REMOVED = (
+    f"(nodeNames) => nodeNames.every({JS_SCENE_NODE_REMOVED.strip()})"
+)
+
+
+def wait_for_scene_nodes(
+    page: Page, node_names: list[str], timeout: int = 10_000
+) -> None:
+    """Wait until every named scene node exists in the Three.js graph."""
+    page.wait_for_function(JS_SCENE_HAS_NODES, arg=node_names, timeout=timeout)
+
+
+def wait_for_scene_nodes_removed(
+    page: Page, node_names: list[str], timeout: int = 10_000
+) -> None:
+    """Wait until every named scene node has been removed from the graph."""
+    page.wait_for_function(JS_SCENE_NODES_REMOVED, arg=node_names, timeout=timeout)
+
+
 def wait_for_mesh_children(
     page: Page, node_name: str, min_count: int = 1, timeout: int = 10_000
 ) -> None:
@@ -214,6 +318,16 @@ def canvas_center(page: Page) -> tuple[float, float]:
     return (box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
 
 
+def canvas_rgb(page: Page) -> np.ndarray:
+    """Screenshot the first ``<canvas>`` and decode it to an ``(H, W, 3)``
+    uint8 array, skipping the mode conversion (and its copy) when the PNG is
+    already RGB."""
+    image = Image.open(BytesIO(page.locator("canvas").first.screenshot()))
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return np.asarray(image)
+
+
 JS_LEASE_REASONS = "() => window.__viserPointer.cameraLockReasons()"
 """Returns the array of currently-held camera-control lock reason
 strings. Used by tests that assert which gesture is suppressing camera
@@ -1,11 +1,7 @@
-from unittest.mock import patch
-
 import viser
-import viser._client_autobuild
 from viser._messages import RegisterCommandMessage, RemoveCommandMessage
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_add_command_returns_handle() -> None:
     """add_command() should return a CommandHandle with correct properties."""
     server = viser.ViserServer()
@@ -17,7 +13,6 @@ def test_add_command_returns_handle() -> None:
     assert handle.icon is None
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_add_command_with_hotkey_and_icon() -> None:
     """add_command() with hotkey and icon should store them correctly."""
     server = viser.ViserServer()
@@ -35,7 +30,6 @@ def test_add_command_with_hotkey_and_icon() -> None:
     assert handle.icon == viser.Icon.DEVICE_FLOPPY
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_on_trigger_callback() -> None:
     """on_trigger decorator should register a callback that can be inspected."""
     server = viser.ViserServer()
@@ -51,7 +45,6 @@ def test_command_on_trigger_callback() -> None:
     assert len(handle._impl.trigger_cb) == 1
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_update_label() -> None:
     """Updating the label should modify the handle's state."""
     server = viser.ViserServer()
@@ -62,7 +55,6 @@ def test_command_update_label() -> None:
     assert handle._impl.props.label == "New Label"
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_update_description() -> None:
     """Updating the description should modify the handle's state."""
     server = viser.ViserServer()
@@ -73,7 +65,6 @@ def test_command_update_description() -> None:
     assert handle._impl.props.description == "Updated"
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_update_icon() -> None:
     """Updating the icon should modify the handle's state and update icon HTML."""
     server = viser.ViserServer()
@@ -89,7 +80,6 @@ def test_command_update_icon() -> None:
     assert handle._impl.props._icon_html is None
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_remove() -> None:
     """Removing a command should mark it as removed and remove from registry."""
     server = viser.ViserServer()
@@ -103,7 +93,6 @@ def test_command_remove() -> None:
     assert uuid not in server.gui._command_handle_from_uuid
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_remove_warns_on_double_remove() -> None:
     """Removing a command twice should emit a warning."""
     import warnings
@@ -120,7 +109,6 @@ def test_command_remove_warns_on_double_remove() -> None:
         assert "already removed" in str(w[0].message)
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_multiple_commands() -> None:
     """Multiple commands can be registered and tracked independently."""
     server = viser.ViserServer()
@@ -136,7 +124,6 @@ def test_multiple_commands() -> None:
     assert h3._impl.uuid in server.gui._command_handle_from_uuid
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_disabled_toggle() -> None:
     """Setting disabled should round-trip correctly."""
     server = viser.ViserServer()
@@ -153,7 +140,6 @@ def test_command_disabled_toggle() -> None:
     assert handle._impl.props.disabled is False
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_register_disabled() -> None:
     """add_command() with disabled=True should set the property."""
     server = viser.ViserServer()
@@ -163,7 +149,6 @@ def test_command_register_disabled() -> None:
     assert handle._impl.props.disabled is True
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_update_hotkey() -> None:
     """Updating the hotkey should modify the handle's state."""
     server = viser.ViserServer()
@@ -180,7 +165,6 @@ def test_command_update_hotkey() -> None:
     assert handle.hotkey is None
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_reset_clears_commands() -> None:
     """reset() should remove all registered commands."""
     server = viser.ViserServer()
@@ -193,7 +177,6 @@ def test_reset_clears_commands() -> None:
     assert len(server.gui._command_handle_from_uuid) == 0
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_sends_register_message() -> None:
     """add_command() should queue a RegisterCommandMessage."""
     server = viser.ViserServer()
@@ -220,7 +203,6 @@ def test_command_sends_register_message() -> None:
     assert register_msgs[0].props.modifier == "cmd/ctrl"
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_remove_sends_remove_message() -> None:
     """remove() should queue a RemoveCommandMessage."""
     server = viser.ViserServer()
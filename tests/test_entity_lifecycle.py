@@ -1,17 +1,13 @@
 """Tests that pin add -> update -> remove lifecycle semantics across every
 removable entity type."""
 
-from unittest.mock import patch
-
 import viser
-import viser._client_autobuild
 
 # ---------------------------------------------------------------------------
 # GUI components
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_gui_add_update_remove_roundtrip() -> None:
     server = viser.ViserServer()
     handle = server.gui.add_number("x", 0.0)
@@ -30,7 +26,6 @@ def test_gui_add_update_remove_roundtrip() -> None:
         assert any("already removed" in str(rec.message) for rec in w)
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_gui_reset_clears_all_registries() -> None:
     server = viser.ViserServer()
     server.gui.add_number("a", 0.0)
@@ -49,7 +44,6 @@ def test_gui_reset_clears_all_registries() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_scene_add_update_remove_roundtrip() -> None:
     server = viser.ViserServer()
     handle = server.scene.add_frame("/frame")
@@ -60,7 +54,6 @@ def test_scene_add_update_remove_roundtrip() -> None:
     assert server.scene._handle_from_node_name.get("/frame") is None
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_scene_parent_remove_cascades() -> None:
     server = viser.ViserServer()
     parent = server.scene.add_frame("/parent")
@@ -78,7 +71,6 @@ def test_scene_parent_remove_cascades() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_add_update_remove_roundtrip() -> None:
     server = viser.ViserServer()
     handle = server.gui.add_command("test", description="desc")
@@ -91,7 +83,6 @@ def test_command_add_update_remove_roundtrip() -> None:
     assert handle._impl.uuid not in server.gui._command_handle_from_uuid
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_reset_clears_registry() -> None:
     server = viser.ViserServer()
     server.gui.add_command("a")
@@ -112,7 +103,6 @@ def test_command_reset_clears_registry() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_modal_open_children_close() -> None:
     server = viser.ViserServer()
     with server.gui.add_modal("title") as modal:
@@ -128,7 +118,6 @@ def test_modal_open_children_close() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_create_remove_coalesce_across_entities() -> None:
     """A Create followed by a Remove (with GC) should leave the buffer at
     starting size for every entity type."""
@@ -15,7 +15,6 @@ from unittest.mock import patch
 import pytest
 
 import viser
-import viser._client_autobuild
 from viser._messages import (
     CommandProps,
     CommandUpdateMessage,
@@ -158,7 +157,6 @@ def test_update_keys_separate_per_prop_set() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_tombstone_is_gcd() -> None:
     """RemoveCommandMessage tombstones must be purged by the declarative GC
     so new clients don't replay removes of commands they never saw."""
@@ -177,7 +175,6 @@ def test_command_tombstone_is_gcd() -> None:
     assert len(buffer) == baseline, "RemoveCommandMessage tombstones not GC'd"
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_scene_node_update_is_purged_after_remove() -> None:
     """SceneNodeUpdateMessage for a removed scene node should be purged by
     GC so a late-joining client doesn't see updates for a node that no longer
@@ -201,7 +198,6 @@ def test_scene_node_update_is_purged_after_remove() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_post_remove_gui_write_raises() -> None:
     server = viser.ViserServer()
     handle = server.gui.add_number("x", 0.0)
@@ -210,7 +206,6 @@ def test_post_remove_gui_write_raises() -> None:
         handle.value = 1.0
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_post_remove_scene_write_raises() -> None:
     server = viser.ViserServer()
     handle = server.scene.add_frame("/test")
@@ -219,7 +214,6 @@ def test_post_remove_scene_write_raises() -> None:
         handle.position = (1.0, 2.0, 3.0)
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_post_remove_command_write_raises() -> None:
     server = viser.ViserServer()
     handle = server.gui.add_command("test")
@@ -228,7 +222,6 @@ def test_post_remove_command_write_raises() -> None:
         handle.label = "new"
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_post_remove_command_icon_setter_raises() -> None:
     """The explicit icon setter path also enforces the removed guard."""
     server = viser.ViserServer()
@@ -243,7 +236,6 @@ def test_post_remove_command_icon_setter_raises() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_modal_double_close_warns() -> None:
     import warnings
 
@@ -265,7 +257,6 @@ def test_modal_double_close_warns() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_command_update_after_remove_is_suppressed() -> None:
     """add_command -> remove -> property write must raise; no residual
     messages for the command should remain in the broadcast buffer."""
@@ -288,7 +279,6 @@ def test_command_update_after_remove_is_suppressed() -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_gc_two_pass_purges_update_buffered_after_tombstone() -> None:
     """Adversarial ordering: a scene Update lands at a HIGHER message id than
     the Remove tombstone (possible via race / direct _queue_update). A
@@ -313,7 +303,6 @@ def test_gc_two_pass_purges_update_buffered_after_tombstone() -> None:
     assert 20 not in buf.message_from_id, "late update survived tombstone"
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_gc_purges_set_position_after_scene_remove() -> None:
     """Scene-node pose ``Set*Message`` variants (declared ``update_simple``)
     must be purged when their target scene node has a tombstone, so a reused
@@ -371,7 +360,6 @@ def test_update_simple_messages_have_distinct_redundancy_slots() -> None:
     assert b0.redundancy_key() != b1.redundancy_key()
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_gc_never_deletes_messages_a_slow_client_has_not_consumed() -> None:
     """The GC's deletion floor is the minimum consumption cursor over ACTIVE
     window generators -- never the shared message_event. Regression: a
@@ -408,7 +396,6 @@ def test_gc_never_deletes_messages_a_slow_client_has_not_consumed() -> None:
         broadcast.generator_cursors.pop(999, None)
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_same_name_replacement_supersedes_old_handle() -> None:
     """Re-adding a node under an existing name (explicitly supported) must
     SUPERSEDE the old handle: (1) the old node's pose updates must not replay
@@ -447,7 +434,6 @@ def test_same_name_replacement_supersedes_old_handle() -> None:
     assert "/replace_me" not in server.scene._handle_from_node_name
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_retry_after_emit_failure_still_clears_drag_bindings() -> None:
     """If a binding-clear emit raises mid-remove(), the handle must keep its
     callback state so a RETRY re-emits everything. Regression: the shared
@@ -496,7 +482,6 @@ def test_remove_retry_after_emit_failure_still_clears_drag_bindings() -> None:
     )
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_post_remove_interaction_callback_registration_raises() -> None:
     """Interaction-callback (de)registration on a removed node raises, like
     property writes: it publishes name-keyed binding messages that would
@@ -515,7 +500,6 @@ def test_post_remove_interaction_callback_registration_raises() -> None:
         handle.remove_drag_callback()
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_post_remove_deferred_decorator_raises() -> None:
     """A decorator factory created BEFORE remove() must still refuse to
     register after it: the factory-time check alone left the returned
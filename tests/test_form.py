@@ -1,10 +1,6 @@
-from unittest.mock import patch
-
 import viser
-import viser._client_autobuild
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_form_submit_fires_callback() -> None:
     """Calling form.submit() should fire all registered on_submit callbacks."""
     server = viser.ViserServer()
@@ -32,7 +28,6 @@ def test_form_submit_fires_callback() -> None:
     assert calls == [("alice", 30), ("bob", 30)]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_form_child_on_update_not_suppressed() -> None:
     """on_update callbacks on form children fire as normal (forms are additive)."""
     server = viser.ViserServer()
@@ -54,7 +49,6 @@ def test_form_child_on_update_not_suppressed() -> None:
     assert keystrokes == ["hello"]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_nested_forms_raise() -> None:
     """Nested forms would produce invalid HTML on the client."""
     import pytest
@@ -89,7 +83,6 @@ def test_nested_forms_raise() -> None:
                 pass
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_submit_callback() -> None:
     """remove_submit_callback should support 'all' and specific callbacks."""
     server = viser.ViserServer()
@@ -1,10 +1,6 @@
-from unittest.mock import patch
-
 import viser
-import viser._client_autobuild
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_scene_node() -> None:
     """Test that viser's internal message buffer is cleaned up properly when we
     remove scene nodes."""
@@ -24,7 +20,6 @@ def test_remove_scene_node() -> None:
     assert len(internal_message_dict) == orig_len
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_gui_element() -> None:
     """Test that viser's internal message buffer is cleaned up properly when we
     remove GUI elements."""
@@ -48,7 +43,6 @@ def test_remove_gui_element() -> None:
     assert len(internal_message_dict) == orig_len
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_gui_in_modal() -> None:
     """Test that viser's internal message buffer is cleaned up properly when we
     remove GUI elements."""
@@ -14,14 +14,12 @@ from __future__ import annotations
 
 import dataclasses
 import inspect
-import socket
 from typing import Generator
 
 import numpy as np
 import pytest
 
 import viser
-import viser._client_autobuild
 from viser import _messages
 
 
@@ -43,24 +41,9 @@ def test_props_dataclasses_have_no_field_defaults() -> None:
     assert not offenders, f"Props fields must not have defaults: {offenders}"
 
 
-def _find_free_port() -> int:
-    with socket.socket() as s:
-        s.bind(("", 0))
-        return s.getsockname()[1]
-
-
 @pytest.fixture()
 def server() -> Generator[viser.ViserServer, None, None]:
-    viser._client_autobuild.ensure_client_is_built = lambda: None
-    server: viser.ViserServer | None = None
-    for attempt in range(3):
-        try:
-            server = viser.ViserServer(port=_find_free_port(), verbose=False)
-            break
-        except OSError:
-            if attempt == 2:
-                raise
-    assert server is not None
+    server = viser.ViserServer(port=0, verbose=False)
     yield server
     server.stop()
 
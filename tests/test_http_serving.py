@@ -12,10 +12,8 @@ import urllib.error
 import urllib.request
 from pathlib import Path
 from typing import Tuple
-from unittest.mock import patch
 
 import viser
-import viser._client_autobuild
 from viser import infra
 
 
@@ -30,7 +28,6 @@ def _raw_get_status(host: str, port: int, raw_target: str) -> int:
         conn.close()
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_http_root_and_traversal():
     server = viser.ViserServer()
     port = server.get_port()
@@ -4,34 +4,17 @@ and warns. The renamed ``thickness`` defaults to world units."""
 
 from __future__ import annotations
 
-import socket
 from typing import Generator
 
 import numpy as np
 import pytest
 
 import viser
-import viser._client_autobuild
-
-
-def _find_free_port() -> int:
-    with socket.socket() as s:
-        s.bind(("", 0))
-        return s.getsockname()[1]
 
 
 @pytest.fixture()
 def server() -> Generator[viser.ViserServer, None, None]:
-    viser._client_autobuild.ensure_client_is_built = lambda: None
-    server: viser.ViserServer | None = None
-    for attempt in range(3):
-        try:
-            server = viser.ViserServer(port=_find_free_port(), verbose=False)
-            break
-        except OSError:
-            if attempt == 2:
-                raise
-    assert server is not None
+    server = viser.ViserServer(port=0, verbose=False)
     yield server
     server.stop()
 
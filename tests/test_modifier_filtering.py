@@ -6,12 +6,11 @@ from __future__ import annotations
 import asyncio
 import time
 from typing import Any, Callable, Coroutine
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 import viser
-import viser._client_autobuild
 from viser import _messages
 from viser.infra import ClientId
 
@@ -76,7 +75,6 @@ def _wait_until(
     )
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_on_click_rejects_invalid_modifier_string() -> None:
     """``on_click(modifier="ctrl")`` is a common typo but the canonical
     string is ``"cmd/ctrl"``. Without validation it silently no-ops
@@ -87,7 +85,6 @@ def test_on_click_rejects_invalid_modifier_string() -> None:
         box.on_click(modifier="ctrl")  # type: ignore[arg-type]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_scene_on_click_rejects_invalid_modifier_string() -> None:
     """Same as above for the scene-level ``on_click``."""
     server = viser.ViserServer()
@@ -95,7 +92,6 @@ def test_scene_on_click_rejects_invalid_modifier_string() -> None:
         server.scene.on_click(modifier="control")  # type: ignore[arg-type]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_on_click_accepts_canonical_modifier_strings() -> None:
     """Known-good modifier strings should not raise."""
     server = viser.ViserServer()
@@ -112,7 +108,6 @@ def test_on_click_accepts_canonical_modifier_strings() -> None:
     assert len(box._impl.click_cb) == 2
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_add_command_rejects_invalid_modifier_string() -> None:
     """``add_command(hotkey="K", modifier="ctrl")`` is the same kind of
     typo as ``on_click(modifier="ctrl")``. Should raise just like the
@@ -123,7 +118,6 @@ def test_add_command_rejects_invalid_modifier_string() -> None:
         server.gui.add_command("X", hotkey="K", modifier="ctrl")  # type: ignore[arg-type]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_add_command_rejects_modifier_without_hotkey() -> None:
     """Passing ``modifier=`` without ``hotkey=`` silently produces an
     unbound command -- the modifier has no key to attach to. This is
@@ -133,7 +127,6 @@ def test_add_command_rejects_modifier_without_hotkey() -> None:
         server.gui.add_command("X", modifier="cmd/ctrl")
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_click_dispatch_iterates_over_snapshot() -> None:
     """A click callback that mutates click_cb during dispatch must not
     affect the in-progress dispatch -- snapshot semantics."""
@@ -183,7 +176,6 @@ def test_click_dispatch_iterates_over_snapshot() -> None:
     assert len(box._impl.click_cb) == 3
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_on_pointer_callback_removed_fires_all_registered() -> None:
     """``on_pointer_callback_removed`` must support multiple
     registrations and fire each one on remove."""
@@ -211,7 +203,6 @@ def test_on_pointer_callback_removed_fires_all_registered() -> None:
     assert sorted(fired) == ["done1", "done2"]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_on_pointer_event_replaces_existing_and_fires_cleanup() -> None:
     """The deprecated ``on_pointer_event`` is single-slot: registering a
     new callback replaces any prior pointer registrations (legacy or
@@ -247,7 +238,6 @@ def test_on_pointer_event_replaces_existing_and_fires_cleanup() -> None:
     assert fired == ["pre-cleanup"]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_click_callback_fires_cleanup_when_list_empties() -> None:
     """The per-event removal APIs (``remove_click_callback`` /
     ``remove_rect_select_callback``) must fire ``on_pointer_callback_removed``
@@ -274,7 +264,6 @@ def test_remove_click_callback_fires_cleanup_when_list_empties() -> None:
     assert len(server.scene._scene_pointer_cb) == 0
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_click_callback_does_not_fire_cleanup_with_remaining_rect_select() -> (
     None
 ):
@@ -306,7 +295,6 @@ def test_remove_click_callback_does_not_fire_cleanup_with_remaining_rect_select(
     assert fired == ["done"]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_pointer_event_server_scope_clears_client_scope_and_vice_versa() -> None:
     """Server-scope and per-client-scope ``on_pointer_event`` share the
     same wire (the ``ScenePointerEnableMessage`` toggle on the client
@@ -351,7 +339,6 @@ def test_pointer_event_server_scope_clears_client_scope_and_vice_versa() -> None
     assert len(fake_client.scene._scene_pointer_cb) == 0
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_on_click_unapplied_decorator_does_not_mark_clickable() -> None:
     """``box.on_click(modifier="shift")`` returns a decorator factory.
     If the user never applies it, the client must not be told the
@@ -380,7 +367,6 @@ def test_on_click_unapplied_decorator_does_not_mark_clickable() -> None:
     assert len(box._impl.click_cb) == 0
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_on_click_rejects_extra_kwargs() -> None:
     """Unknown kwargs to ``on_click`` should fail loudly."""
     server = viser.ViserServer()
@@ -389,7 +375,6 @@ def test_on_click_rejects_extra_kwargs() -> None:
         box.on_click(foo=1)  # type: ignore[call-overload]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_on_drag_rejects_extra_positional_args() -> None:
     """``on_drag("left", "right")`` is a typo; should raise.
 
@@ -401,7 +386,6 @@ def test_on_drag_rejects_extra_positional_args() -> None:
         box.on_drag("left", "right")  # type: ignore[call-overload]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_click_callback_targets_only_click_callbacks() -> None:
     """``remove_click_callback`` clears scene click registrations and
     leaves rect-select registrations intact."""
@@ -422,7 +406,6 @@ def test_remove_click_callback_targets_only_click_callbacks() -> None:
     assert remaining == ["rect-select"]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_rect_select_callback_targets_only_rect_callbacks() -> None:
     server = viser.ViserServer()
 
@@ -439,7 +422,6 @@ def test_remove_rect_select_callback_targets_only_rect_callbacks() -> None:
     assert remaining == ["click"]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_click_callback_with_specific_function() -> None:
     server = viser.ViserServer()
 
@@ -456,7 +438,6 @@ def test_remove_click_callback_with_specific_function() -> None:
     assert callbacks == [cb_b]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_pointer_event_unapplied_decorator_does_not_destroy_callbacks() -> None:
     """Calling ``on_pointer_event(...)`` returns a decorator factory.
     If the user never applies it (typo, exception, etc.), no
@@ -476,7 +457,6 @@ def test_pointer_event_unapplied_decorator_does_not_destroy_callbacks() -> None:
     assert len(server.scene._scene_pointer_cb) == 1
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_pointer_dispatch_iterates_over_snapshot() -> None:
     """Same as click -- pointer dispatch must use snapshot semantics."""
 
@@ -508,7 +488,6 @@ def test_pointer_dispatch_iterates_over_snapshot() -> None:
     assert len(server.scene._scene_pointer_cb) == 2
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_pointer_event_supports_multiple_callbacks_simultaneously() -> None:
     """Registering two callbacks on different event_types should keep
     both alive (no overwrite)."""
@@ -527,7 +506,6 @@ def test_pointer_event_supports_multiple_callbacks_simultaneously() -> None:
     assert event_types == {"click", "rect-select"}
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_pointer_event_modifier_dispatch_filters_correctly() -> None:
     """Two callbacks on the same event_type with different modifiers
     should each fire only when their modifier matches."""
@@ -572,7 +550,6 @@ def test_pointer_event_modifier_dispatch_filters_correctly() -> None:
     assert fired == ["cmd"]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_click_dispatch_filters_by_modifier() -> None:
     """Two click callbacks with different modifiers should each fire
     only when their modifier matches."""
@@ -615,7 +592,6 @@ def test_click_dispatch_filters_by_modifier() -> None:
     assert fired == ["shift"]
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_on_click_dedups_redundant_wire_emits() -> None:
     """Each ``box.on_click(...)`` call emits exactly one
     ``SetSceneNodeClickBindingsMessage`` with the growing bindings
@@ -670,7 +646,6 @@ def test_on_click_dedups_redundant_wire_emits() -> None:
     assert len(new_bindings) == 1 and new_bindings[0].bindings == ()
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_publish_click_state_cache_rolls_back_on_queue_failure() -> None:
     """If ``queue_message`` raises mid-publish (e.g. websocket dropped),
     the dedup cache must NOT have been updated -- otherwise the next
@@ -761,7 +736,6 @@ def test_publish_click_state_cache_rolls_back_on_queue_failure() -> None:
     )
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_remove_node_purges_click_bindings_in_persistent_buffer() -> None:
     """When a node is removed, both the legacy ``Clickable`` flag and
     the new ``ClickBindings`` set must be cleared in the persistent
@@ -13,12 +13,10 @@ import asyncio
 import threading
 import warnings
 from typing import Any
-from unittest.mock import patch
 
 import pytest
 
 import viser
-import viser._client_autobuild
 from viser import _messages as m
 from viser._gui_handles import CONTROL_PANEL_ID
 
@@ -664,7 +662,6 @@ def test_remove_panel_removes_group() -> None:
         server.stop()
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_control_layout_deprecation_translates_to_dock_right() -> None:
     server = viser.ViserServer()
     try:
@@ -683,7 +680,6 @@ def test_control_layout_deprecation_translates_to_dock_right() -> None:
         server.stop()
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_control_layout_floating_does_not_warn_or_place() -> None:
     server = viser.ViserServer()
     try:
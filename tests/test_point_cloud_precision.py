@@ -7,15 +7,11 @@ dtype. These pin the behavior that ``precision`` and ``points`` stay consistent
 regardless of assignment order.
 """
 
-from unittest.mock import patch
-
 import numpy as np
 
 import viser
-import viser._client_autobuild
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_point_cloud_precision_roundtrip() -> None:
     server = viser.ViserServer()
     try:
@@ -50,7 +46,6 @@ def test_point_cloud_precision_roundtrip() -> None:
         server.stop()
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_points_assignment_coerced_to_precision() -> None:
     """A ``points`` assignment is always stored at the cloud's current
     precision, regardless of the input array's dtype."""
@@ -1,14 +1,27 @@
-from unittest.mock import patch
+from typing import Generator
+
+import pytest
 
 import viser
-import viser._client_autobuild
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_remove_parent_removes_children() -> None:
-    """Removing a parent node should cascade to all descendants."""
-    server = viser.ViserServer()
+@pytest.fixture(scope="module")
+def _module_server() -> Generator[viser.ViserServer, None, None]:
+    # These tests only exercise scene-tree bookkeeping, so one server (and one
+    # websocket thread) is shared by the module.
+    server = viser.ViserServer(port=0, verbose=False)
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def server(_module_server: viser.ViserServer) -> viser.ViserServer:
+    _module_server.scene.reset()
+    return _module_server
 
+
+def test_remove_parent_removes_children(server: viser.ViserServer) -> None:
+    """Removing a parent node should cascade to all descendants."""
     parent = server.scene.add_frame("/parent")
     child = server.scene.add_frame("/parent/child")
     grandchild = server.scene.add_frame("/parent/child/grandchild")
@@ -23,11 +36,8 @@ def test_remove_parent_removes_children() -> None:
     assert "/parent/child/grandchild" not in server.scene._handle_from_node_name
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_remove_leaf_preserves_parent() -> None:
+def test_remove_leaf_preserves_parent(server: viser.ViserServer) -> None:
     """Removing a leaf node should not affect its parent."""
-    server = viser.ViserServer()
-
     parent = server.scene.add_frame("/parent")
     child = server.scene.add_frame("/parent/child")
 
@@ -43,11 +53,8 @@ def test_remove_leaf_preserves_parent() -> None:
     )
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_get_handle_by_name() -> None:
+def test_get_handle_by_name(server: viser.ViserServer) -> None:
     """get_handle_by_name should return handles and None appropriately."""
-    server = viser.ViserServer()
-
     handle = server.scene.add_frame("/test_node")
     assert server.scene.get_handle_by_name("/test_node") is handle
 
@@ -55,11 +62,8 @@ def test_get_handle_by_name() -> None:
     assert server.scene.get_handle_by_name("/test_node") is None
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_get_handle_by_name_after_parent_removal() -> None:
+def test_get_handle_by_name_after_parent_removal(server: viser.ViserServer) -> None:
     """Children should not be findable after parent removal."""
-    server = viser.ViserServer()
-
     server.scene.add_frame("/a")
     server.scene.add_frame("/a/b")
 
@@ -69,11 +73,8 @@ def test_get_handle_by_name_after_parent_removal() -> None:
     assert server.scene.get_handle_by_name("/a/b") is None
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_intermediate_frames_auto_created() -> None:
+def test_intermediate_frames_auto_created(server: viser.ViserServer) -> None:
     """Adding /a/b/c should auto-create /a and /a/b as invisible frames."""
-    server = viser.ViserServer()
-
     server.scene.add_frame("/a/b/c")
 
     assert "/a" in server.scene._handle_from_node_name
@@ -87,11 +88,8 @@ def test_intermediate_frames_auto_created() -> None:
     assert not ab_handle._impl.props.show_axes
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_remove_with_intermediate_frames() -> None:
+def test_remove_with_intermediate_frames(server: viser.ViserServer) -> None:
     """Removing a root node should cascade through auto-created intermediates."""
-    server = viser.ViserServer()
-
     server.scene.add_frame("/a/b/c")
 
     a_handle = server.scene._handle_from_node_name["/a"]
@@ -108,11 +106,8 @@ def test_remove_with_intermediate_frames() -> None:
     assert "/a/b/c" not in server.scene._handle_from_node_name
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_name_normalized_with_leading_slash() -> None:
+def test_name_normalized_with_leading_slash(server: viser.ViserServer) -> None:
     """Names without a leading '/' should be normalized."""
-    server = viser.ViserServer()
-
     handle = server.scene.add_frame("grandparent/parent/child")
 
     # Should be stored with leading slash.
@@ -128,11 +123,8 @@ def test_name_normalized_with_leading_slash() -> None:
     assert server.scene.get_handle_by_name("grandparent/parent/child") is handle
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_remove_by_name_without_leading_slash() -> None:
+def test_remove_by_name_without_leading_slash(server: viser.ViserServer) -> None:
     """remove_by_name should work without a leading '/'."""
-    server = viser.ViserServer()
-
     server.scene.add_frame("grandparent/parent/child")
     server.scene.remove_by_name("grandparent")
 
@@ -141,11 +133,8 @@ def test_remove_by_name_without_leading_slash() -> None:
     assert "/grandparent/parent/child" not in server.scene._handle_from_node_name
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
-def test_cascade_removal_without_leading_slash() -> None:
+def test_cascade_removal_without_leading_slash(server: viser.ViserServer) -> None:
     """Cascade removal should work for nodes added without leading '/'."""
-    server = viser.ViserServer()
-
     grandparent = server.scene.add_frame("grandparent")
     parent = server.scene.add_frame("grandparent/parent")
     child = server.scene.add_frame("grandparent/parent/child")
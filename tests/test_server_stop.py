@@ -2,13 +2,10 @@ import socket
 import subprocess
 import sys
 import time
-from unittest.mock import patch
 
 import viser
-import viser._client_autobuild
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_server_port_is_freed():
     server = viser.ViserServer()
     original_port = server.get_port()
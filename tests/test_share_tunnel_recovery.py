@@ -15,7 +15,6 @@ import time
 from unittest.mock import patch
 
 import viser
-import viser._client_autobuild
 import viser._tunnel
 import viser._viser
 
@@ -60,7 +59,6 @@ class _FakeTunnel:
         self._status = "closed"
 
 
-@patch.object(viser._client_autobuild, "ensure_client_is_built", lambda: None)
 def test_request_share_url_recovers_after_failure() -> None:
     _FakeTunnel.behaviors = ["fail", "connect"]
     _FakeTunnel.instances = []